@@ -1,7 +1,7 @@
 import os
 
 from .data import DataContainer
-from .signals import Signal
+from .signals import Signal, SignalSet
 
 
 class BaseAnalyzer:
@@ -31,6 +31,18 @@ class PairedAnalyzer(BaseAnalyzer):
 
 
 class SignalDataAnalyzer(BaseAnalyzer):
-    def __init__(self, data_dir, results_dir, signal: Signal) -> None:
+    def __init__(self, data_dir, results_dir, signal: Signal | SignalSet) -> None:
         super().__init__(data_dir, results_dir)
         self.signal = signal
+
+    def get_signal(self, channel=None) -> Signal:
+        """
+        Return the analyzed signal, or its channel `channel` if it is a SignalSet.
+        """
+        if isinstance(self.signal, SignalSet):
+            if channel is None:
+                raise ValueError(
+                    "A `channel` must be given when analyzing a SignalSet."
+                )
+            return self.signal[channel]
+        return self.signal
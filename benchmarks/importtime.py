@@ -0,0 +1,104 @@
+"""
+Import-time benchmark: measures the cold-start cost of importing each module
+of the package in a fresh interpreter (`python -X importtime`).
+
+Run as `python -m analyzer.benchmarks.importtime [--output ...] [--baseline ...]`.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from .results import compare_to_baseline, load_results, save_results
+
+PACKAGE = (__package__ or "analyzer").split(".")[0]
+MODULES = [
+    "data",
+    "signals",
+    "resampling",
+    "base",
+    "stats",
+    "plotting",
+    "signalanalysis",
+    "integratedanalyzer",
+    "marketdata",
+    "fetching",
+    "indicators",
+    "finance",
+]
+
+
+def measure_import_time(module: str, repeat: int = 5) -> float:
+    """
+    Best-of-`repeat` cumulative import time (in seconds) of `module`, each
+    measured in a new interpreter.
+    """
+    pkg_parent = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [pkg_parent] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else [])
+    )
+    times = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise ImportError(
+                f"Importing {module} failed: {proc.stderr.strip().splitlines()[-1]}"
+            )
+        times.append(_cumulative_us(proc.stderr, module) / 1e6)
+    return min(times)
+
+
+def _cumulative_us(importtime_log: str, module: str) -> int:
+    """
+    Cumulative time (us) of `module` from a `-X importtime` log, where lines
+    read `import time: <self> | <cumulative> | <indented module name>`.
+    """
+    for line in importtime_log.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise ValueError(f"No import time found for {module}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="Save results as JSON to this file.")
+    parser.add_argument("--baseline", help="Compare with results saved earlier.")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = {}
+    failed = False
+    for module in MODULES:
+        name = f"{PACKAGE}.{module}"
+        try:
+            import_time = measure_import_time(name, repeat=args.repeat)
+        except ImportError as e:
+            print(e)
+            failed = True
+            continue
+        results[f"import {name}"] = {"import_time": import_time}
+        print(f"{name}: {import_time * 1e3:.1f} ms")
+
+    if args.output is not None:
+        save_results(results, args.output)
+    if args.baseline is not None:
+        regressions = compare_to_baseline(
+            results, load_results(args.baseline), threshold=args.threshold
+        )
+        for msg in regressions:
+            print(f"REGRESSION {msg}")
+        failed = failed or len(regressions) > 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+import json
+import os
+import platform
+import sys
+from datetime import datetime
+
+
+def save_results(results: dict, fpath: str) -> None:
+    """
+    Save benchmark `results` ({name: {metric: value}}) as JSON, along with
+    some information about the machine they were measured on.
+    """
+    data = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+        },
+        "benchmarks": results,
+    }
+    tar_dir = os.path.dirname(fpath)
+    if tar_dir:
+        os.makedirs(tar_dir, exist_ok=True)
+    with open(fpath, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_results(fpath: str) -> dict:
+    """
+    Load benchmark results saved by `save_results`.
+    """
+    with open(fpath) as f:
+        return json.load(f)["benchmarks"]
+
+
+def compare_to_baseline(results: dict, baseline: dict, threshold=0.2) -> list[str]:
+    """
+    Compare `results` to `baseline` and return a message for every metric
+    that got more than `threshold` (relative) worse. Benchmarks or metrics
+    missing from either side are skipped.
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            base_value = baseline.get(name, {}).get(metric)
+            if base_value is None or base_value <= 0:
+                continue
+            change = value / base_value - 1
+            if change > threshold:
+                regressions.append(
+                    f"{name} [{metric}]: {base_value:.4g} -> {value:.4g} (+{change:.0%})"
+                )
+    return regressions
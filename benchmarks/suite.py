@@ -0,0 +1,241 @@
+"""
+Benchmark suite for the data, stats, signal and plotting hot paths, run on
+synthetic data of several sizes. Records wall time (best of `--repeat`) and
+peak traced memory per benchmark.
+
+Run as `python -m analyzer.benchmarks [--output ...] [--baseline ...]`.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable
+
+from ..data import DataContainer
+from ..signals import Signal
+from .results import compare_to_baseline, load_results, save_results
+from .synthetic import clinical_table, long_signal
+
+# Each case maps a size to a zero-argument callable that runs the benchmarked code
+CASES: dict[str, tuple[Callable[[int, str], Callable], tuple[int, ...]]] = {}
+
+
+def case(name: str, sizes: tuple[int, ...]):
+    """
+    Register a benchmark case; the decorated function takes (size, tmp_dir)
+    and returns the callable to time.
+    """
+
+    def register(setup):
+        CASES[name] = (setup, sizes)
+        return setup
+
+    return register
+
+
+@case("read_data", sizes=(10_000, 100_000, 1_000_000))
+def _read_data(size, tmp_dir):
+    fpath = os.path.join(tmp_dir, f"clinical_{size}.csv")
+    clinical_table(size).to_csv(fpath, index=False)
+    return lambda: DataContainer(fpath)
+
+
+@case("filter", sizes=(10_000, 100_000, 1_000_000))
+def _filter(size, tmp_dir):
+    data = DataContainer.from_dataframe(clinical_table(size))
+    matchlist = {"sex": "F", "age": lambda col: col > 40}
+    return lambda: data.filter(matchlist)
+
+
+@case("merge_with", sizes=(10_000, 100_000, 1_000_000))
+def _merge_with(size, tmp_dir):
+    df = clinical_table(size)
+    left = DataContainer.from_dataframe(df[["MRN", "age", "var0"]])
+    right = DataContainer.from_dataframe(df[["MRN", "bmi", "var1"]].sample(frac=1))
+    return lambda: left.merge_with(right, on="MRN")
+
+
+@case("StatisticalAnalyzer", sizes=(1_000, 5_000))
+def _statistical_analyzer(size, tmp_dir):
+    from ..stats import StatisticalAnalyzer
+
+    data = DataContainer.from_dataframe(clinical_table(size, n_numeric=16))
+    cols = [col for col in data.df.columns if col.startswith("var")]
+    return lambda: StatisticalAnalyzer(tmp_dir, tmp_dir, data, cols)
+
+
+@case("PairedStatisticalAnalyzer", sizes=(1_000, 5_000))
+def _paired_statistical_analyzer(size, tmp_dir):
+    from ..stats import PairedStatisticalAnalyzer
+
+    data1 = DataContainer.from_dataframe(clinical_table(size, n_numeric=16, seed=1))
+    data2 = DataContainer.from_dataframe(clinical_table(size, n_numeric=16, seed=2))
+    cols = [col for col in data1.df.columns if col.startswith("var")]
+    return lambda: PairedStatisticalAnalyzer(tmp_dir, tmp_dir, data1, data2, cols)
+
+
+@case("calculate_corr_cols", sizes=(10_000, 100_000, 1_000_000))
+def _calculate_corr_cols(size, tmp_dir):
+    from ..stats import StatisticalAnalyzer
+
+    data = DataContainer.from_dataframe(clinical_table(size))
+    anal = StatisticalAnalyzer(tmp_dir, tmp_dir, data, [])
+    anal.normality = {"var0": (True, 1.0), "var1": (False, 0.0)}  # skip Shapiro-Wilk
+    return lambda: anal.calculate_corr_cols("var0", "var1")
+
+
+@case("calculate_partial_corr", sizes=(10_000, 100_000))
+def _calculate_partial_corr(size, tmp_dir):
+    from ..stats import StatisticalAnalyzer
+
+    data = DataContainer.from_dataframe(clinical_table(size))
+    anal = StatisticalAnalyzer(tmp_dir, tmp_dir, data, [])
+    return lambda: anal.calculate_partial_corr("var0", "var2", ["age", "bmi"])
+
+
+@case("perform_emd", sizes=(2_000, 10_000))
+def _perform_emd(size, tmp_dir):
+    from ..signalanalysis import SignalProcessor
+
+    x, y = long_signal(size, irregular=False)
+    anal = SignalProcessor(tmp_dir, tmp_dir, Signal(y, x=x))
+    return anal.perform_emd
+
+
+@case("Signal.interpolate", sizes=(100_000, 1_000_000, 10_000_000))
+def _signal_interpolate(size, tmp_dir):
+    x, y = long_signal(size)
+
+    def run():
+        Signal(y, x=x).interpolate(min_res=0.5)
+
+    return run
+
+
+@case("Signal.interpolate[datetime]", sizes=(100_000, 1_000_000))
+def _signal_interpolate_datetime(size, tmp_dir):
+    x, y = long_signal(size, as_datetime=True)
+
+    def run():
+        Signal(y, x=x, x_as_datetime=True).interpolate(min_res="500ms")
+
+    return run
+
+
+@case("save_plot", sizes=(10_000, 100_000))
+def _save_plot(size, tmp_dir):
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from ..plotting import GenericGraphicalAnalyzer
+
+    x, y = long_signal(size)
+    fig, ax = plt.subplots()
+    ax.plot(x, y)
+    anal = GenericGraphicalAnalyzer(tmp_dir, tmp_dir)
+    return lambda: anal.save_plot(fig, f"signal_{size}")
+
+
+def measure(func: Callable, repeat: int = 3) -> dict:
+    """
+    Best-of-`repeat` wall time (s) of `func()` and its peak traced memory
+    (bytes, from one extra run under tracemalloc). A warm-up call first keeps
+    one-off costs such as lazy imports out of the timings.
+    """
+    func()
+    wall_times = []
+    for _ in range(repeat):
+        t_start = time.perf_counter()
+        func()
+        wall_times.append(time.perf_counter() - t_start)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"wall_time": min(wall_times), "peak_memory": peak_memory}
+
+
+def run_suite(
+    names=None, max_size=None, repeat: int = 3, verbose: bool = True
+) -> tuple[dict, list[str]]:
+    """
+    Run the registered cases (all, or those in `names`) at every size up to
+    `max_size`. Cases whose optional dependencies are missing are skipped;
+    cases that fail are reported and listed in the returned `failed`.
+    """
+    results, failed = {}, []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, (setup, sizes) in CASES.items():
+            if names is not None and name not in names:
+                continue
+            for size in sizes:
+                if max_size is not None and size > max_size:
+                    continue
+                bench_name = f"{name}[{size}]"
+                try:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        func = setup(size, tmp_dir)
+                        result = measure(func, repeat=repeat)
+                except ImportError as e:
+                    if verbose:
+                        print(f"{bench_name}: skipped ({e})")
+                    break
+                except Exception as e:
+                    if verbose:
+                        print(f"{bench_name}: failed ({type(e).__name__}: {e})")
+                    failed.append(bench_name)
+                    continue
+                results[bench_name] = result
+                if verbose:
+                    print(
+                        f"{bench_name}: {result['wall_time'] * 1e3:.1f} ms, "
+                        f"peak {result['peak_memory'] / 2**20:.1f} MiB"
+                    )
+    return results, failed
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("cases", nargs="*", help="Cases to run (default: all).")
+    parser.add_argument("--max-size", type=int, help="Skip larger sizes.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="Save results as JSON to this file.")
+    parser.add_argument("--baseline", help="Compare with results saved earlier.")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--list", action="store_true", help="List cases and exit.")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, (_, sizes) in CASES.items():
+            print(f"{name}: sizes {', '.join(str(size) for size in sizes)}")
+        return 0
+    unknown = set(args.cases) - set(CASES)
+    if unknown:
+        parser.error(f"Unknown case(s): {', '.join(sorted(unknown))}")
+
+    results, failed = run_suite(
+        names=args.cases or None, max_size=args.max_size, repeat=args.repeat
+    )
+    if args.output is not None:
+        save_results(results, args.output)
+    if args.baseline is not None:
+        regressions = compare_to_baseline(
+            results, load_results(args.baseline), threshold=args.threshold
+        )
+        for msg in regressions:
+            print(f"REGRESSION {msg}")
+        return 1 if (regressions or failed) else 0
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
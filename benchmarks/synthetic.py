@@ -0,0 +1,53 @@
+"""
+Synthetic data generators for the benchmarks (no files or network needed).
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def clinical_table(n_rows: int, n_numeric: int = 8, seed: int = 0) -> pd.DataFrame:
+    """
+    Clinical-style table: unique MRNs, a visit date, a few categorical columns
+    and `n_numeric` numeric columns (alternately normal and skewed), plus
+    covariates `age` and `bmi`.
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "MRN": rng.permutation(n_rows) + 10_000_000,
+            "visit_date": pd.Timestamp("2010-01-01")
+            + pd.to_timedelta(rng.integers(0, 5000, n_rows), unit="D"),
+            "sex": rng.choice(["F", "M"], n_rows),
+            "site": rng.choice(["A", "B", "C", "D"], n_rows),
+            "age": rng.normal(55, 15, n_rows).round(),
+            "bmi": rng.normal(27, 5, n_rows),
+        }
+    )
+    for i in range(n_numeric):
+        if i % 2 == 0:
+            df[f"var{i}"] = rng.normal(0, 1, n_rows) + 0.01 * df["age"]
+        else:
+            df[f"var{i}"] = rng.lognormal(0, 1, n_rows)
+    return df
+
+
+def long_signal(
+    n_samples: int, irregular: bool = True, as_datetime: bool = False, seed: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Long noisy multi-tone signal as (x, y). With `irregular`, x is sampled at
+    jittered intervals (as in real recordings), otherwise evenly. With
+    `as_datetime`, x is datetime64 at ~1 s spacing.
+    """
+    rng = np.random.default_rng(seed)
+    steps = rng.uniform(0.5, 1.5, n_samples) if irregular else np.ones(n_samples)
+    x = np.cumsum(steps)
+    y = (
+        np.sin(2 * np.pi * x / 500)
+        + 0.5 * np.sin(2 * np.pi * x / 37)
+        + 0.1 * rng.normal(size=n_samples)
+    )
+    if as_datetime:
+        x = np.datetime64("2020-01-01") + (x * 1e9).astype("timedelta64[ns]")
+    return x, y
@@ -0,0 +1,122 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+import pandas as pd
+
+from .marketdata import DataProvider, Timestamp
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter: allows bursts of up to `capacity`
+    requests and `rate` requests per second on average.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Block until `tokens` tokens are available, then take them.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+@dataclass
+class FetchResult:
+    ticker: str
+    start: Timestamp
+    end: pd.Timestamp
+    data: Optional[pd.DataFrame] = None
+    error: Optional[Exception] = None
+    attempts: int = 0
+
+
+class FetchScheduler:
+    """
+    Fetch many (ticker, date range) tasks from a `DataProvider` on a thread
+    pool of `max_workers`, at most `rate` requests per second (if given), and
+    with up to `max_attempts` attempts per task, waiting `backoff` seconds
+    (doubled on every retry, capped at `max_backoff`) between attempts.
+    """
+
+    def __init__(
+        self,
+        provider: DataProvider,
+        max_workers: int = 8,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        max_attempts: int = 3,
+        backoff: float = 1.0,
+        max_backoff: float = 30.0,
+    ) -> None:
+        self.provider = provider
+        self.max_workers = max_workers
+        self.limiter = TokenBucket(rate, burst) if rate is not None else None
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def fetch(
+        self, ticker: str, start: Timestamp, end: pd.Timestamp, interval: str
+    ) -> FetchResult:
+        """
+        Fetch one task, retrying on errors; never raises.
+        """
+        result = FetchResult(ticker, start, end)
+        delay = self.backoff
+        while result.attempts < self.max_attempts:
+            if result.attempts > 0:
+                time.sleep(delay)
+                delay = min(2 * delay, self.max_backoff)
+            if self.limiter is not None:
+                self.limiter.acquire()
+            result.attempts += 1
+            try:
+                result.data = self.provider.fetch(ticker, start, end, interval)
+                result.error = None
+                return result
+            except Exception as e:
+                result.error = e
+        return result
+
+    def fetch_all(
+        self,
+        tasks: Iterable[tuple[str, Timestamp, pd.Timestamp]],
+        interval: str,
+    ) -> Iterator[FetchResult]:
+        """
+        Fetch all (ticker, start, end) `tasks` concurrently, yielding each
+        result as soon as it is done (failed tasks carry their last error).
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self.fetch, ticker, start, end, interval)
+                for ticker, start, end in tasks
+            ]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:  # stop pending tasks if the caller stops early
+                    future.cancel()
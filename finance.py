@@ -1,10 +1,46 @@
+import os
 from datetime import date, datetime
-from typing import List, Optional, cast
+from typing import Iterator, List, Optional
 
 import pandas as pd
-import yfinance as yf
 
 from analyzer.base import BaseAnalyzer
+from analyzer.fetching import FetchScheduler
+from analyzer.indicators import IndicatorEngine
+from analyzer.marketdata import DataProvider, MarketDataStore
+
+
+class YahooProvider:
+    """
+    Fetch bars of one ticker at a time from Yahoo Finance. yfinance does not
+    raise when a download fails (it logs the error and returns no bars), so
+    an empty result is raised as an error to be retried by `FetchScheduler`.
+    """
+
+    def fetch(
+        self,
+        ticker: str,
+        start: Optional[pd.Timestamp],
+        end: pd.Timestamp,
+        interval: str,
+    ) -> pd.DataFrame:
+        import yfinance as yf
+
+        if start is None:
+            df = yf.download(
+                ticker, period="max", end=end, interval=interval, progress=False
+            )
+        else:
+            df = yf.download(
+                ticker, start=start, end=end, interval=interval, progress=False
+            )
+        if df is None or len(df) == 0:
+            raise ValueError(
+                f"No '{interval}' bars returned for '{ticker}' in [{start}, {end})."
+            )
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = df.columns.get_level_values(0)
+        return df
 
 
 class FinanceDataAnalyzer(BaseAnalyzer):
@@ -12,11 +48,24 @@ class FinanceDataAnalyzer(BaseAnalyzer):
     df: pd.DataFrame
 
     def __init__(
-        self, data_dir: str, results_dir: str, tickers: List, fpath_data: str
+        self,
+        data_dir: str,
+        results_dir: str,
+        tickers: List,
+        fpath_data: Optional[str] = None,
+        provider: Optional[DataProvider] = None,
+        fetch_opts={},
     ) -> None:
         super().__init__(data_dir, results_dir)
         self.tickers = tickers
         self.fpath_data = fpath_data
+        self.provider = provider if provider is not None else YahooProvider()
+        self.store = MarketDataStore(
+            os.path.join(os.path.expanduser(data_dir), "market_data")
+        )
+        self.scheduler = FetchScheduler(self.provider, **fetch_opts)
+        self.failed_tickers: dict[str, Exception] = {}
+        self.indicators: Optional[IndicatorEngine] = None
 
     def download_data(
         self,
@@ -27,12 +76,153 @@ class FinanceDataAnalyzer(BaseAnalyzer):
     ):
         """
         Download Yahoo data as a dataframe for all tickers (if not already exists).
+        Only date ranges missing from the local store (`<data_dir>/market_data`)
+        are fetched; the dataframe is then read from the store and written to
+        `fpath_data` (as .xlsx) if given. Tickers that could not be fetched are
+        listed in `failed_tickers`.
         """
-        self.df = cast(
-            pd.DataFrame,
-            yf.download(
-                self.tickers, period=period, interval=interval, start=start, end=end
-            ),
-        )
-        self.df.columns = ["_".join(col) for col in self.df.columns]
-        self.df.to_excel(self.fpath_data)
+        for _ in self.iter_download(period, interval, start, end):
+            pass
+        start_ts, end_ts = _resolve_date_range(period, start, end)
+        self.load_data(interval=interval, start=start_ts, end=end_ts)
+        if self.fpath_data is not None:
+            self.df.to_excel(self.fpath_data)
+
+    def iter_download(
+        self,
+        period: Optional[str] = None,
+        interval: str = "1d",
+        start: Optional[str | datetime | date] = None,
+        end: Optional[str | datetime | date] = None,
+    ) -> Iterator[tuple[str, pd.DataFrame]]:
+        """
+        Fetch missing data of all tickers concurrently (see `fetch_opts`) and
+        yield each (ticker, dataframe) as soon as that ticker is up to date,
+        so one slow or failing ticker does not hold back the others.
+        """
+        start_ts, end_ts = _resolve_date_range(period, start, end)
+        today = pd.Timestamp.today().normalize()
+        self.failed_tickers = {}
+
+        # Collect the missing date ranges of every ticker
+        tasks = []
+        n_pending = {}
+        for ticker in self.tickers:
+            missing = self.store.missing_intervals(ticker, interval, start_ts, end_ts)
+            tasks += [
+                (ticker, miss_start, miss_end) for miss_start, miss_end in missing
+            ]
+            n_pending[ticker] = len(missing)
+
+        # Tickers that are already up to date are served from the store right away
+        for ticker, n in n_pending.items():
+            if n == 0:
+                yield ticker, self.store.read(ticker, interval, start_ts, end_ts)
+
+        # Merge fetched ranges into the store as they arrive
+        for result in self.scheduler.fetch_all(tasks, interval):
+            if result.error is not None:
+                if result.ticker not in self.failed_tickers:
+                    print(
+                        f"Failed to fetch '{result.ticker}' after {result.attempts} attempt(s): {result.error}"
+                    )
+                self.failed_tickers[result.ticker] = result.error
+            else:
+                self.store.merge(
+                    result.ticker,
+                    interval,
+                    result.data if result.data is not None else pd.DataFrame(),
+                    result.start,
+                    result.end,
+                    complete_before=today,
+                )
+            n_pending[result.ticker] -= 1
+            if (
+                n_pending[result.ticker] == 0
+                and result.ticker not in self.failed_tickers
+            ):
+                yield result.ticker, self.store.read(
+                    result.ticker, interval, start_ts, end_ts
+                )
+
+    def indicator_engine(self) -> IndicatorEngine:
+        """
+        Indicator engine over `df`. It is built on first use; afterwards only
+        bars from its last date on are added, so running statistics are
+        updated incrementally as new data is downloaded. It is rebuilt if it
+        holds no bars yet, if `df` starts before its first date (backfilled
+        history) or if `df` has columns it does not know (e.g. a ticker that
+        failed to download before).
+        """
+        engine = self.indicators
+        if (
+            engine is None
+            or len(engine.dates) == 0
+            or not engine.has_columns(self.df.columns)
+            or (len(self.df) > 0 and self.df.index[0] < engine.dates[0])
+        ):
+            self.indicators = IndicatorEngine(self.df)
+        else:
+            last_date = engine.dates[-1]
+            engine.update(self.df.loc[self.df.index >= last_date])
+        return self.indicators
+
+    def load_data(
+        self,
+        interval: str = "1d",
+        start: Optional[str | datetime | date] = None,
+        end: Optional[str | datetime | date] = None,
+    ):
+        """
+        Read data of all tickers from the local store (no download) as one
+        dataframe with `<field>_<ticker>` columns.
+        """
+        frames = {}
+        for ticker in self.tickers:
+            df = self.store.read(
+                ticker,
+                interval,
+                start=pd.Timestamp(start) if start is not None else None,
+                end=pd.Timestamp(end) if end is not None else None,
+            )
+            if len(df) > 0:
+                frames[ticker] = df
+        if len(frames) == 0:
+            self.df = pd.DataFrame()
+            return self.df
+        df = pd.concat(frames, axis=1).swaplevel(axis=1).sort_index(axis=1)
+        df.columns = ["_".join(col) for col in df.columns]
+        self.df = df
+        return self.df
+
+
+def _resolve_date_range(
+    period: Optional[str],
+    start: Optional[str | datetime | date],
+    end: Optional[str | datetime | date],
+) -> tuple[Optional[pd.Timestamp], pd.Timestamp]:
+    """
+    Turn yfinance-style `period`/`start`/`end` args into a [start, end) range;
+    a None start means the full history. As in yfinance, the period defaults
+    to '1mo' if neither `start` nor `end` is given.
+    """
+    if period is None and start is None and end is None:
+        period = "1mo"
+    end_ts = (
+        pd.Timestamp(end)
+        if end is not None
+        else pd.Timestamp.today().normalize() + pd.Timedelta(days=1)
+    )
+    if start is not None:
+        return pd.Timestamp(start), end_ts
+    if period is None or period == "max":
+        return None, end_ts
+    if period == "ytd":
+        return pd.Timestamp(year=end_ts.year, month=1, day=1), end_ts
+    if period.endswith("mo"):
+        return end_ts - pd.DateOffset(months=int(period[:-2])), end_ts
+    if period.endswith("y"):
+        return end_ts - pd.DateOffset(years=int(period[:-1])), end_ts
+    if period.endswith("d"):
+        return end_ts - pd.Timedelta(days=int(period[:-1])), end_ts
+    raise ValueError(f"The `period={period}` is not recognized.")
@@ -0,0 +1,242 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .utils.buffers import GrowableArray
+
+
+class IndicatorEngine:
+    """
+    Market data of many tickers as a (ticker, time, field) array, with returns
+    and rolling-window statistics computed for all tickers at once.
+
+    Rolling statistics are differences of running cumulative sums, so any
+    window costs O(n_tickers * n_times), and `update` extends the running sums
+    with new bars only instead of recomputing them.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        """
+        Initialize the engine from a `<field>_<ticker>` dataframe indexed by
+        date (as built by `FinanceDataAnalyzer.download_data`). A tz-aware
+        index (e.g. intraday bars) keeps its timezone in `dates`.
+        """
+        pairs = [col.split("_", 1) for col in df.columns]
+        self.fields = list(dict.fromkeys(field for field, _ in pairs))
+        self.tickers = list(dict.fromkeys(ticker for _, ticker in pairs))
+        self._ticker_pos = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self.tz = pd.DatetimeIndex(df.index).tz
+        self._dates = GrowableArray(np.dtype("datetime64[ns]"))
+        self._values = GrowableArray(float, (len(self.tickers), len(self.fields)))
+
+        # Running sums per source (field or returns), see `_running_sums`
+        self._sums: dict[tuple, tuple[GrowableArray, GrowableArray, GrowableArray]] = {}
+        self._shifts: dict[tuple, np.ndarray] = {}
+        self.update(df)
+
+    @property
+    def dates(self) -> pd.DatetimeIndex:
+        dates = pd.DatetimeIndex(self._dates.data)
+        if self.tz is not None:
+            return dates.tz_localize("UTC").tz_convert(self.tz)
+        return dates
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        View of all bars as a (ticker, time, field) array.
+        """
+        return self._values.data.transpose(1, 0, 2)
+
+    def field(self, field: str = "Close") -> np.ndarray:
+        """
+        (ticker, time) view of one field.
+        """
+        return self._values.data[:, :, self.fields.index(field)].T
+
+    def has_columns(self, columns) -> bool:
+        """
+        Whether all `<field>_<ticker>` `columns` are known to the engine.
+        """
+        for col in columns:
+            field, _, ticker = col.partition("_")
+            if ticker not in self._ticker_pos or field not in self.fields:
+                return False
+        return True
+
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        Add new bars from a `<field>_<ticker>` dataframe. Stored bars from the
+        first date in `df` on are replaced, and running sums are only
+        recomputed from there.
+        """
+        if len(df) == 0:
+            return
+        df = df.sort_index()
+        index = pd.DatetimeIndex(df.index)
+        if (index.tz is None) != (self.tz is None):
+            raise ValueError(
+                f"Cannot add bars with timezone {index.tz} to bars with timezone {self.tz}."
+            )
+        if index.tz is not None:
+            index = index.tz_convert("UTC").tz_localize(None)  # stored as naive UTC
+        dates = index.as_unit("ns").to_numpy()
+
+        # Scatter columns into a (time, ticker, field) block; absent pairs are NaN
+        i_tickers, i_fields = [], []
+        for col in df.columns:
+            field, ticker = col.split("_", 1)
+            if ticker not in self._ticker_pos or field not in self.fields:
+                raise ValueError(f"Unknown column '{col}' in update.")
+            i_tickers.append(self._ticker_pos[ticker])
+            i_fields.append(self.fields.index(field))
+        block = np.full((len(df), len(self.tickers), len(self.fields)), np.nan)
+        block[:, i_tickers, i_fields] = df.to_numpy(dtype=float)
+
+        start = int(np.searchsorted(self._dates.data, dates[0], side="left"))
+        self._dates.write(start, dates)
+        self._values.write(start, block)
+        for key in self._sums:
+            self._extend_sums(key, start)
+
+    def returns(self, field: str = "Close", log: bool = False) -> np.ndarray:
+        """
+        (ticker, time) simple (or log) returns of `field`; NaN at the first bar.
+        """
+        return self._source(("returns", field, log), 0).T
+
+    def rolling_mean(
+        self, window: int, field: str = "Close", source: str = "field"
+    ) -> np.ndarray:
+        """
+        (ticker, time) moving average of `field` (or of its returns if
+        `source='returns'`) over the last `window` bars; NaN until `window`
+        valid bars are available.
+        """
+        key = self._key(field, source)
+        csum, _, count = self._running_sums(key)
+        s, n = _window_sum(csum, window), _window_sum(count, window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = s / n
+        mean += self._shifts[key]
+        mean[n < window] = np.nan
+        return mean.T
+
+    def rolling_std(
+        self, window: int, field: str = "Close", source: str = "field", ddof: int = 1
+    ) -> np.ndarray:
+        """
+        (ticker, time) rolling standard deviation (see `rolling_mean`).
+        """
+        key = self._key(field, source)
+        csum, csum2, count = self._running_sums(key)
+        s, n = _window_sum(csum, window), _window_sum(count, window)
+        s2 = _window_sum(csum2, window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            var = (s2 - s * s / n) / (n - ddof)
+        np.maximum(var, 0.0, out=var)  # round-off can make a zero variance negative
+        std = np.sqrt(var)
+        std[(n < window) | (n <= ddof)] = np.nan
+        return std.T
+
+    def volatility(
+        self, window: int, field: str = "Close", periods_per_year: int = 252
+    ) -> np.ndarray:
+        """
+        (ticker, time) annualized rolling volatility of log returns of `field`.
+        """
+        std = self.rolling_std(window, field, source="log_returns")
+        return std * np.sqrt(periods_per_year)
+
+    def correlation(
+        self, field: str = "Close", window: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Ticker x ticker correlation of returns of `field` over the last
+        `window` bars (all bars if None), using pairwise complete bars.
+        """
+        rets = self._source(("returns", field, False), 0)
+        if window is not None:
+            rets = rets[-window:]
+        return pd.DataFrame(rets, columns=self.tickers).corr()
+
+    def to_frame(self, values: np.ndarray) -> pd.DataFrame:
+        """
+        Wrap a (ticker, time) result as a date x ticker dataframe.
+        """
+        return pd.DataFrame(values.T, index=self.dates, columns=self.tickers)
+
+    def _key(self, field: str, source: str) -> tuple:
+        if source == "field":
+            return ("field", field)
+        if source == "returns":
+            return ("returns", field, False)
+        if source == "log_returns":
+            return ("returns", field, True)
+        raise ValueError(f"The `source={source}` is not recognized.")
+
+    def _source(self, key: tuple, start: int) -> np.ndarray:
+        """
+        (time, ticker) values of source `key` from bar `start` on.
+        """
+        if key[0] == "field":
+            return self._values.data[start:, :, self.fields.index(key[1])]
+        _, field, log = key
+        prices = self._values.data[max(start - 1, 0) :, :, self.fields.index(field)]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rets = prices[1:] / prices[:-1]
+            rets = np.log(rets) if log else rets - 1.0
+        if start == 0:
+            rets = np.concatenate([np.full((1, prices.shape[1]), np.nan), rets])
+        return rets
+
+    def _extend_sums(self, key: tuple, start: int) -> None:
+        """
+        Recompute the running sums of `key` from bar `start` on.
+        """
+        csum, csum2, count = self._sums[key]
+        x = self._source(key, start) - self._shifts[key]
+        valid = ~np.isnan(x)
+        x = np.where(valid, x, 0.0)
+        for buf, increments in ((csum, x), (csum2, x * x), (count, valid)):
+            buf.resize(start + 1 + len(x))
+            cum = buf.data[start + 1 :]
+            np.cumsum(increments, axis=0, dtype=float, out=cum)
+            cum += buf.data[start]
+
+    def _running_sums(
+        self, key: tuple
+    ) -> tuple[GrowableArray, GrowableArray, GrowableArray]:
+        """
+        Running sums of values, squared values and valid-value counts of `key`
+        (created on first use and kept up to date by `update`).
+        """
+        if key not in self._sums:
+            # Shift each ticker by its first valid value to limit round-off
+            x = self._source(key, 0)
+            valid = ~np.isnan(x)
+            first = np.where(valid.any(axis=0), valid.argmax(axis=0), 0)
+            shift = x[first, np.arange(x.shape[1])]
+            self._shifts[key] = np.where(np.isnan(shift), 0.0, shift)
+            zeros = np.zeros((1, len(self.tickers)))
+            self._sums[key] = (
+                GrowableArray.from_array(zeros),
+                GrowableArray.from_array(zeros),
+                GrowableArray.from_array(zeros),
+            )
+            self._extend_sums(key, 0)
+        return self._sums[key]
+
+
+def _window_sum(running_sum: GrowableArray, window: int) -> np.ndarray:
+    """
+    (time, ticker) sums over the last `window` bars from a running sum
+    (whose first row is zero).
+    """
+    if window < 1:
+        raise ValueError(f"Window must be at least 1, got {window}")
+    cum = running_sum.data
+    sums = cum[1:].copy()
+    sums[window:] -= cum[1:-window]
+    return sums
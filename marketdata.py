@@ -0,0 +1,162 @@
+import json
+import os
+from typing import Optional, Protocol
+
+import pandas as pd
+
+Timestamp = Optional[pd.Timestamp]  # None stands for "from the beginning"
+
+
+class DataProvider(Protocol):
+    """
+    Source of market data bars, e.g. `finance.YahooProvider` (or a local fake
+    in tests).
+    """
+
+    def fetch(
+        self, ticker: str, start: Timestamp, end: pd.Timestamp, interval: str
+    ) -> pd.DataFrame:
+        """
+        Return the bars of `ticker` with `start` <= date < `end`, indexed by
+        date, with one column per field (Open, High, Low, Close, ...).
+        """
+        ...
+
+
+class MarketDataStore:
+    """
+    Local per-ticker store of market data bars. Bars of each ticker are kept
+    in a Parquet file (`<root>/<interval>/<ticker>.parquet`), and a JSON file
+    per interval records which date range has already been fetched for each
+    ticker, so that only missing ranges need to be downloaded.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+
+    def _dir(self, interval: str) -> str:
+        return os.path.join(self.root, interval)
+
+    def _fpath(self, ticker: str, interval: str) -> str:
+        return os.path.join(self._dir(interval), f"{ticker.replace('/', '%')}.parquet")
+
+    def _read_coverages(self, interval: str) -> dict:
+        fpath = os.path.join(self._dir(interval), "coverage.json")
+        if not os.path.exists(fpath):
+            return {}
+        with open(fpath) as f:
+            return json.load(f)
+
+    def coverage(
+        self, ticker: str, interval: str
+    ) -> Optional[tuple[Timestamp, pd.Timestamp]]:
+        """
+        Date range [start, end) already fetched for `ticker`, if any.
+        """
+        cov = self._read_coverages(interval).get(ticker)
+        if cov is None:
+            return None
+        start, end = cov
+        return (pd.Timestamp(start) if start is not None else None), pd.Timestamp(end)
+
+    def missing_intervals(
+        self, ticker: str, interval: str, start: Timestamp, end: pd.Timestamp
+    ) -> list[tuple[Timestamp, pd.Timestamp]]:
+        """
+        Date ranges that must be fetched so that the store covers [start, end).
+        The covered range is kept contiguous, so a request disjoint from it
+        also fetches the gap in between.
+        """
+        cov = self.coverage(ticker, interval)
+        if cov is None:
+            return [(start, end)]
+        cov_start, cov_end = cov
+        missing = []
+        if cov_start is not None and (start is None or start < cov_start):
+            missing.append((start, cov_start))
+        if end > cov_end:
+            missing.append((cov_end, end))
+        return missing
+
+    def read(
+        self,
+        ticker: str,
+        interval: str,
+        start: Timestamp = None,
+        end: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        """
+        Read the stored bars of `ticker` with `start` <= date < `end`.
+        """
+        fpath = self._fpath(ticker, interval)
+        if not os.path.exists(fpath):
+            return pd.DataFrame()
+        df = pd.read_parquet(fpath)
+        mask = pd.Series(True, index=df.index)
+        if start is not None:
+            mask &= df.index >= _align_tz(start, df.index)
+        if end is not None:
+            mask &= df.index < _align_tz(end, df.index)
+        return df.loc[mask.to_numpy()]
+
+    def merge(
+        self,
+        ticker: str,
+        interval: str,
+        df: pd.DataFrame,
+        start: Timestamp,
+        end: pd.Timestamp,
+        complete_before: Optional[pd.Timestamp] = None,
+    ) -> None:
+        """
+        Merge freshly fetched bars `df` for [start, end) into the store (new
+        bars replace stored ones at the same date) and extend the coverage up
+        to the last bar received (which is fetched again next time, along
+        with anything after it). An empty `df` leaves the coverage unchanged,
+        so a failed download that returned no bars is not mistaken for an
+        empty range. Bars at or after `complete_before` (e.g. today's, still
+        changing) are stored but not marked as covered either.
+        """
+        if len(df) == 0:
+            return
+        os.makedirs(self._dir(interval), exist_ok=True)
+        stored = self.read(ticker, interval)
+        merged = pd.concat([stored, df]) if len(stored) > 0 else df
+        merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+        fpath = self._fpath(ticker, interval)
+        merged.to_parquet(fpath + ".tmp")
+        os.replace(fpath + ".tmp", fpath)
+
+        # Compare in the (naive) wall time of the bars, as `read` does
+        last_bar = pd.Timestamp(df.index.max())
+        if last_bar.tzinfo is not None:
+            last_bar = last_bar.tz_localize(None)
+        end = min(end, last_bar)
+        if complete_before is not None:
+            end = min(end, complete_before)
+        coverages = self._read_coverages(interval)
+        cov = self.coverage(ticker, interval)
+        if cov is not None:
+            cov_start, cov_end = cov
+            start = (
+                None if (start is None or cov_start is None) else min(start, cov_start)
+            )
+            end = max(end, cov_end)
+        coverages[ticker] = [
+            start.isoformat() if start is not None else None,
+            end.isoformat(),
+        ]
+        fpath = os.path.join(self._dir(interval), "coverage.json")
+        with open(fpath + ".tmp", "w") as f:
+            json.dump(coverages, f, indent=2)
+        os.replace(fpath + ".tmp", fpath)
+
+
+def _align_tz(ts: pd.Timestamp, index: pd.Index) -> pd.Timestamp:
+    """
+    Localize/convert `ts` to the time zone of `index` so they can be compared.
+    """
+    tz = getattr(index, "tz", None)
+    if tz is None:
+        return ts.tz_convert(None) if ts.tzinfo is not None else ts
+    return ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
@@ -1,12 +1,13 @@
 import os
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.axes import Axes
-from matplotlib.gridspec import GridSpec
 
 from .base import BaseAnalyzer, PairedAnalyzer, SignalDataAnalyzer, SingleDataAnalyzer
+from .signals import SignalSet
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
 
 
 class GenericGraphicalAnalyzer(BaseAnalyzer):
@@ -32,25 +33,37 @@ class GenericGraphicalAnalyzer(BaseAnalyzer):
 
 class SignalGraphicalAnalyzer(SignalDataAnalyzer, GenericGraphicalAnalyzer):
 
-    def plot_signal(self, ax: Optional[Axes] = None, fontsize=13):
+    def plot_signal(self, ax: Optional["Axes"] = None, fontsize=13, channel=None):
         """
-        Plot signal vs its index.
+        Plot signal vs its index. For a SignalSet without a `channel`,
+        all channels are drawn in one plot.
         """
+        import matplotlib.pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots(figsize=(8, 6))
-        y, x = self.signal.series.to_numpy(), self.signal.series.index
-        y_range = np.max(y) - np.min(y)
+        if isinstance(self.signal, SignalSet) and channel is None:
+            y, x = self.signal.values, self.signal.x
+            y_lbl = None
+            for i_ch, lbl in enumerate(self.signal.y_lbls):
+                plt.plot(x, y[:, i_ch], lw=2, label=str(lbl))
+            plt.legend(fontsize=fontsize)
+        else:
+            signal = self.get_signal(channel)
+            y, x = signal.series.to_numpy(), signal.series.index
+            y_lbl = signal.y_lbl
+            plt.plot(x, y, "k", lw=2)
+        y_range = np.nanmax(y) - np.nanmin(y)
         y_lim = [
-            np.min(y) - y_range * 0.1,
-            np.max(y) + y_range * 0.1,
+            np.nanmin(y) - y_range * 0.1,
+            np.nanmax(y) + y_range * 0.1,
         ]
-        plt.plot(x, y, "k", lw=2)
         plt.xlabel(
             self.signal.x_lbl if self.signal.x_lbl is not None else "",
             fontsize=fontsize,
         )
         plt.ylabel(
-            self.signal.y_lbl if self.signal.y_lbl is not None else "",
+            y_lbl if y_lbl is not None else "",
             fontsize=fontsize,
         )
         plt.xlim([np.min(x), np.max(x)])
@@ -61,11 +74,16 @@ class SignalGraphicalAnalyzer(SignalDataAnalyzer, GenericGraphicalAnalyzer):
         plt.show()
         return ax
 
-    def plot_signals_rowwise_EMD(self, imfs: np.ndarray, ax: Optional[Axes] = None):
+    def plot_signals_rowwise_EMD(
+        self, imfs: np.ndarray, ax: Optional["Axes"] = None, channel=None
+    ):
         """
         Plot IMFs as layered subplots, specialized for EMD.
         """
-        y, x = self.signal.series.to_numpy(), self.signal.series.index
+        import matplotlib.pyplot as plt
+
+        signal = self.get_signal(channel)
+        y, x = signal.series.to_numpy(), signal.series.index
         if ax is None:
             _, ax = plt.subplots(figsize=(12, 12))
         n_imfs = imfs.shape[0]
@@ -98,6 +116,8 @@ class PairedGraphicalAnalyzer(PairedAnalyzer, GenericGraphicalAnalyzer):
         Create a pair of overlapping histograms from the data contained
         in the column `col` of both the data containers.
         """
+        import matplotlib.pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots()
         ax.hist(
@@ -128,6 +148,8 @@ class GraphicalAnalyzer(SingleDataAnalyzer, GenericGraphicalAnalyzer):
         """
         Create an histogram of the data contained in column `col`.
         """
+        import matplotlib.pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots()
         ax.hist(
@@ -154,6 +176,8 @@ class GraphicalAnalyzer(SingleDataAnalyzer, GenericGraphicalAnalyzer):
         """
         Plot multiple columns of df in one plot.
         """
+        import matplotlib.pyplot as plt
+
         if col_x is not None:
             df = self.df[[col_x] + cols_y]
             df.set_index(col_x, inplace=True)
@@ -183,6 +207,8 @@ class GraphicalAnalyzer(SingleDataAnalyzer, GenericGraphicalAnalyzer):
         """
         Create a scatter plot from data in columns `col1` and `col2`.
         """
+        import matplotlib.pyplot as plt
+
         if ax is None:
             _, ax = plt.subplots()
         ax.scatter(self.df[col1], self.df[col2])
@@ -198,6 +224,9 @@ class GraphicalAnalyzer(SingleDataAnalyzer, GenericGraphicalAnalyzer):
         """
         Create a scatter plot from data in columns `col1` and `col2`.
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.gridspec import GridSpec
+
         if ax is None:
             fig = plt.figure()
         else:
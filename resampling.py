@@ -0,0 +1,131 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+# pandas interpolation methods handled by the resampler, as (kind, spline order)
+RESAMPLE_METHODS = {
+    "linear": ("linear", None),
+    "time": ("linear", None),
+    "index": ("linear", None),
+    "values": ("linear", None),
+    "nearest": ("nearest", None),
+    "slinear": ("spline", 1),
+    "quadratic": ("spline", 2),
+    "cubic": ("spline", 3),
+}
+
+
+def to_numeric_axis(x: pd.Index | np.ndarray) -> np.ndarray:
+    """
+    Return x as a numeric array; datetimes become int64 nanoseconds (UTC for
+    tz-aware x) so that datetime and numeric axes share one code path.
+    """
+    if isinstance(x, pd.DatetimeIndex):
+        return x.as_unit("ns").asi8
+    x = np.asarray(x)
+    if x.dtype.kind == "M":
+        return x.astype("datetime64[ns]").view(np.int64)
+    return x
+
+
+def resample(
+    x: np.ndarray,
+    y: np.ndarray,
+    grid: np.ndarray,
+    method: str = "linear",
+    order: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Evaluate samples (`x`, `y`) on `grid`, writing into `out` (allocated if
+    not given). `x` must be sorted and unique; `y` is either 1-D or 2-D with
+    one column per channel. `method` is 'linear', 'nearest' or 'spline' (of
+    order `order`, default 3). Grid points outside `x` take the edge values
+    for 'linear' and 'nearest'.
+    """
+    n = len(x)
+    if len(y) != n:
+        raise ValueError(f"Length of x ({n}) does not match length of y ({len(y)})")
+    if n == 0:
+        raise ValueError("Cannot resample an empty signal.")
+    if out is None:
+        out = np.empty((len(grid),) + y.shape[1:], dtype=np.result_type(y, float))
+    elif out.shape != (len(grid),) + y.shape[1:]:
+        raise ValueError(
+            f"`out` has shape {out.shape}, expected {(len(grid),) + y.shape[1:]}"
+        )
+    if len(grid) == 0:
+        return out
+    if n == 1:
+        out[...] = y[0]
+        return out
+
+    if method == "linear":
+        # Locate the bracketing samples x[pos - 1] <= g < x[pos] of every grid point
+        pos = np.searchsorted(x, grid, side="right")
+        np.clip(pos, 1, n - 1, out=pos)
+        x0 = x[pos - 1]
+        w = (grid - x0).astype(float)
+        w /= x[pos] - x0
+        np.clip(w, 0.0, 1.0, out=w)
+
+        # out = y0 + (y1 - y0) * w, evaluated for all channels at once
+        y0 = np.take(y, pos - 1, axis=0).astype(out.dtype, copy=False)
+        dy = np.take(y, pos, axis=0).astype(out.dtype, copy=False)
+        dy -= y0
+        dy *= w.reshape((-1,) + (1,) * (y.ndim - 1))
+        np.add(y0, dy, out=out)
+    elif method == "nearest":
+        pos = np.searchsorted(x, grid, side="left")
+        np.clip(pos, 1, n - 1, out=pos)
+        take_left = (grid - x[pos - 1]) <= (x[pos] - grid)
+        pos -= take_left
+        out[...] = np.take(y, pos, axis=0)  # not `out=`, which needs y's dtype
+    elif method == "spline":
+        from scipy.interpolate import make_interp_spline
+
+        k = 3 if order is None else order
+        spline = make_interp_spline(x - x[0], y, k=min(k, n - 1), axis=0)
+        out[...] = spline(grid - x[0])
+    else:
+        raise ValueError(f"The `method={method}` is not recognized.")
+    return out
+
+
+def resample_chunked(
+    x: np.ndarray,
+    y: np.ndarray,
+    grid: np.ndarray,
+    method: str = "linear",
+    order: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
+    chunk_size: int = 1_000_000,
+    spline_margin: int = 64,
+) -> np.ndarray:
+    """
+    Same as `resample`, but processes `grid` in chunks of `chunk_size` points
+    and only reads the samples each chunk needs. With memory-mapped `x`, `y`
+    and `out` (e.g. from `Signal.open` and `np.lib.format.open_memmap`), this
+    resamples signals that do not fit in memory. Splines are fitted locally on
+    `spline_margin` extra samples on either side of each chunk.
+    """
+    n = len(x)
+    if out is None:
+        out = np.empty((len(grid),) + y.shape[1:], dtype=np.result_type(y, float))
+    margin = spline_margin if method == "spline" else 0
+    for start in range(0, len(grid), chunk_size):
+        stop = min(start + chunk_size, len(grid))
+        grid_chunk = np.asarray(grid[start:stop])
+        lo = np.searchsorted(x, grid_chunk[0], side="right") - 1 - margin
+        hi = np.searchsorted(x, grid_chunk[-1], side="left") + 1 + margin
+        lo, hi = max(lo, 0), min(hi, n)
+        resample(
+            np.asarray(x[lo:hi]),
+            np.asarray(y[lo:hi]),
+            grid_chunk,
+            method=method,
+            order=order,
+            out=out[start:stop],
+        )
+    return out
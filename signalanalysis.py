@@ -1,11 +1,21 @@
-from PyEMD import EMD
-
 from .base import SignalDataAnalyzer
+from .signals import SignalSet
 
 
 class SignalProcessor(SignalDataAnalyzer):
 
-    def perform_emd(self):
+    def perform_emd(self, channel=None):
+        """
+        Decompose the signal into IMFs. For a SignalSet without a `channel`,
+        returns a dict of IMFs for every channel.
+        """
+        from PyEMD import EMD
+
         emd = EMD()  # initialize EMD object
-        imfs = emd.emd(self.signal.series.to_numpy())
+        if isinstance(self.signal, SignalSet) and channel is None:
+            return {
+                y_lbl: emd.emd(self.signal.values[:, i_ch].copy())
+                for i_ch, y_lbl in enumerate(self.signal.y_lbls)
+            }
+        imfs = emd.emd(self.get_signal(channel).series.to_numpy())
         return imfs
@@ -1,3 +1,4 @@
+import json
 import os
 from collections import abc
 from dataclasses import dataclass
@@ -8,13 +9,16 @@ import numpy as np
 import pandas as pd
 from pandas._typing import InterpolateOptions
 
+from .resampling import RESAMPLE_METHODS, resample, resample_chunked, to_numeric_axis
+from .utils.buffers import GrowableArray
+
 
 class DuplicatePolicy(Enum):
 
     ERROR = "error"  # raise if duplicates
     FIRST = "first"  # keep first occurrence
     LAST = "last"  # keep first occurrence
-    MEAN = "mean"  # average y for duplicate x
+    MEAN = "mean"  # average y for duplicate x (per `Signal.append` call)
 
 
 @dataclass
@@ -23,9 +27,51 @@ class PreprocessConfig:
     duplicates: DuplicatePolicy = DuplicatePolicy.ERROR
 
 
+def _as_array(values: abc.Iterable) -> np.ndarray:
+    """
+    Return `values` as a 1-D array without going through a Python list.
+    Buffers of ndarray, Series and Index inputs are reused where possible.
+    """
+    if isinstance(values, (pd.Series, pd.Index)):
+        return values.to_numpy(copy=False)
+    if isinstance(values, (np.ndarray, abc.Sequence)) or hasattr(values, "__array__"):
+        return np.asarray(values)
+    return np.asarray(list(values))  # generators and other one-shot iterables
+
+
+def _as_index(
+    x: abc.Iterable, as_datetime: bool = False, datetime_format: Optional[str] = None
+) -> pd.Index:
+    """
+    Return `x` as a pandas Index, converting to datetime in a vectorized way
+    if `as_datetime` is set.
+    """
+    if as_datetime:
+        if isinstance(x, pd.DatetimeIndex):
+            return x
+        if not isinstance(x, (pd.Series, pd.Index, np.ndarray)):
+            x = _as_array(x)
+        return pd.DatetimeIndex(pd.to_datetime(x, format=datetime_format))
+    if isinstance(x, pd.Index):
+        return x
+    return pd.Index(_as_array(x), copy=False)
+
+
+_STORAGE_VERSION = 1
+_META_FNAME = "meta.json"
+_VALUES_FNAME = "values.npy"
+_INDEX_FNAME = "index.npy"
+
+
 class Signal:
     series: pd.Series
 
+    # Growable storage backing `series` after `append` (see `Signal.append`)
+    _values_buf: Optional[GrowableArray] = None
+    _index_buf: Optional[GrowableArray] = None
+    _buffered_series: Optional[pd.Series] = None
+    _x_sorted: bool = False
+
     def __init__(
         self,
         y: abc.Iterable,
@@ -37,24 +83,23 @@ class Signal:
         cfg: PreprocessConfig = PreprocessConfig(),
     ) -> None:
         """
-        Initialize the Signal object.
+        Initialize the Signal object. ndarray, Series and Index inputs are
+        wrapped without copying where their dtypes allow, so the signal may
+        share memory with the caller's `y` (and `x`).
         """
 
-        # Convert x to dt if it contains dt data and if conversion is needed
+        # Convert x to an index (as dt if it contains dt data and if conversion is needed)
         self.x_as_datetime = x_as_datetime
-        if x_as_datetime and x is not None:
-            try:
-                x = pd.to_datetime([w for w in x], format=datetime_format)
-            except Exception as e:
-                raise e
+        if x is not None:
+            x = _as_index(x, as_datetime=x_as_datetime, datetime_format=datetime_format)
 
-        # Store x and y as a series
-        y_list = [w for w in y]
-        self.series = pd.Series(data=y_list, index=x, name=y_lbl)
+        # Store x and y as a series, sharing the caller's buffers where dtypes allow
+        self.series = pd.Series(data=_as_array(y), index=x, name=y_lbl, copy=False)
 
         # Store other init args in Signal obj
         self.x_lbl = x_lbl
         self.y_lbl = y_lbl
+        self.cfg = cfg
 
         # Preprocess series as per given config
         self.preprocess(cfg)
@@ -70,17 +115,158 @@ class Signal:
         x_lbl: Optional[str] = None,
         cfg: PreprocessConfig = PreprocessConfig(),
     ):
-        concatenated_series = pd.concat(
-            [left.series, right.series], ignore_index=ignore_x
-        )
-        return cls(
-            concatenated_series,
-            x=concatenated_series.index,
+        """
+        Concatenate two signals; `right` is appended to a copy of `left`, so
+        only its samples (and any overlap with `left`) are preprocessed anew.
+        """
+        n_left, n_right = len(left.series), len(right.series)
+        obj = cls(
+            left.series.to_numpy(copy=False),
+            x=np.arange(n_left) if ignore_x else left.series.index,
             y_lbl=y_lbl,
             x_lbl=x_lbl,
             cfg=cfg,
             x_as_datetime=x_as_datetime,
         )
+        obj.append(
+            right.series.to_numpy(copy=False),
+            x=np.arange(n_left, n_left + n_right) if ignore_x else right.series.index,
+        )
+        return obj
+
+    @classmethod
+    def from_series(
+        cls,
+        series: pd.Series,
+        x_as_datetime: bool = False,
+        x_lbl: Optional[str] = None,
+        cfg: PreprocessConfig = PreprocessConfig(),
+    ):
+        """
+        Wrap an already preprocessed series as a Signal (no copy, no preprocessing).
+        """
+        obj = cls.__new__(cls)
+        obj.series = series
+        obj.x_as_datetime = x_as_datetime
+        obj.x_lbl = x_lbl
+        obj.y_lbl = series.name
+        obj.cfg = cfg
+        return obj
+
+    @classmethod
+    def open(cls, path: str, mmap_mode: Optional[str] = "r"):
+        """
+        Open a signal written by `Signal.save`. The value and index arrays are
+        memory-mapped (unless `mmap_mode` is None), so nothing is read from disk
+        until the data is accessed.
+        """
+        with open(os.path.join(path, _META_FNAME)) as f:
+            meta = json.load(f)
+        if meta.get("version") != _STORAGE_VERSION:
+            raise ValueError(f"Unsupported signal storage version in {path}")
+
+        values = np.load(os.path.join(path, _VALUES_FNAME), mmap_mode=mmap_mode)
+        index_meta = meta["index"]
+        if index_meta["kind"] == "range":
+            index = pd.RangeIndex(
+                index_meta["start"], index_meta["stop"], index_meta["step"]
+            )
+        else:
+            index_arr = np.load(os.path.join(path, _INDEX_FNAME), mmap_mode=mmap_mode)
+            if index_arr.dtype.kind == "M":
+                index = pd.DatetimeIndex(index_arr, copy=False)
+                if index_meta.get("tz") is not None:
+                    index = index.tz_localize("UTC").tz_convert(index_meta["tz"])
+            else:
+                index = pd.Index(index_arr, copy=False)
+
+        cfg = PreprocessConfig(
+            sort_x=meta["cfg"]["sort_x"],
+            duplicates=DuplicatePolicy(meta["cfg"]["duplicates"]),
+        )
+        series = pd.Series(values, index=index, name=meta["y_lbl"], copy=False)
+        return cls.from_series(
+            series, x_as_datetime=meta["x_as_datetime"], x_lbl=meta["x_lbl"], cfg=cfg
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Save the signal to directory `path` as raw value and index arrays
+        (`.npy`) plus a JSON file holding labels and preprocessing metadata.
+        Each file is written to a temporary file first and then moved into
+        place, so a signal opened (memory-mapped) from `path` can be saved
+        back to it.
+        """
+        values = self.series.to_numpy()
+        if values.dtype == object:
+            raise ValueError("Cannot save a signal with non-numeric values.")
+
+        index = self.series.index
+        if isinstance(index, pd.RangeIndex):
+            index_meta = {
+                "kind": "range",
+                "start": index.start,
+                "stop": index.stop,
+                "step": index.step,
+            }
+            index_arr = None
+        elif isinstance(index, pd.DatetimeIndex):
+            index_meta = {
+                "kind": "array",
+                "tz": None if index.tz is None else str(index.tz),
+            }
+            if index.tz is not None:
+                index = index.tz_convert("UTC").tz_localize(None)
+            index_arr = index.to_numpy()
+        else:
+            index_meta = {"kind": "array"}
+            index_arr = index.to_numpy()
+            if index_arr.dtype == object:
+                raise ValueError("Cannot save a signal with a non-numeric x.")
+
+        os.makedirs(path, exist_ok=True)
+        _save_atomic(os.path.join(path, _VALUES_FNAME), lambda f: np.save(f, values))
+        if index_arr is not None:
+            _save_atomic(
+                os.path.join(path, _INDEX_FNAME), lambda f: np.save(f, index_arr)
+            )
+        elif os.path.exists(os.path.join(path, _INDEX_FNAME)):
+            os.remove(os.path.join(path, _INDEX_FNAME))
+        meta = {
+            "version": _STORAGE_VERSION,
+            "y_lbl": self.y_lbl,
+            "x_lbl": self.x_lbl,
+            "x_as_datetime": self.x_as_datetime,
+            "cfg": {"sort_x": self.cfg.sort_x, "duplicates": self.cfg.duplicates.value},
+            "index": index_meta,
+        }
+        _save_atomic(
+            os.path.join(path, _META_FNAME),
+            lambda f: f.write(json.dumps(meta, indent=2).encode()),
+        )
+
+    def slice_x(self, start=None, end=None):
+        """
+        Return the part of the signal with `start` <= x <= `end` as a view.
+        For x-sorted signals this is a binary search, so a memory-mapped
+        signal only reads the pages covering the requested range.
+        """
+        if not self.cfg.sort_x:
+            return Signal.from_series(
+                self.series.loc[start:end],
+                x_as_datetime=self.x_as_datetime,
+                x_lbl=self.x_lbl,
+                cfg=self.cfg,
+            )
+        index = self.series.index
+        i_start = 0 if start is None else index.searchsorted(start, side="left")
+        i_end = len(index) if end is None else index.searchsorted(end, side="right")
+        return Signal.from_series(
+            self.series.iloc[i_start:i_end],
+            x_as_datetime=self.x_as_datetime,
+            x_lbl=self.x_lbl,
+            cfg=self.cfg,
+        )
 
     @classmethod
     def from_spreadsheet_file(
@@ -111,7 +297,7 @@ class Signal:
         y_lbl = col_y
         x_lbl = col_x
         return cls(
-            y,
+            y.to_numpy(copy=False),
             x=x,
             x_as_datetime=x_as_datetime,
             datetime_format=datetime_format,
@@ -121,25 +307,312 @@ class Signal:
         )
 
     def preprocess(self, cfg: PreprocessConfig):
+        self.series = _preprocess_series(self.series, cfg)
+
+    def append(
+        self,
+        y: abc.Iterable,
+        x: Optional[abc.Iterable] = None,
+        datetime_format: Optional[str] = None,
+    ) -> None:
+        """
+        Append samples to the signal in amortized O(len(y)) time. The signal
+        keeps growable value/x buffers (doubling their capacity when full),
+        and `self.cfg` is enforced by merging the new chunk only with the
+        existing samples at or after its smallest x. If `x` is None, x
+        continues from `len(self.series)` (datetime signals require `x`).
+
+        Signals whose x is not sorted (nor `cfg.sort_x` set) are merged as a
+        whole, as are signals whose x or y is not a plain NumPy dtype (e.g.
+        tz-aware datetimes). After an append, `self.series` is a view of the
+        buffers; a chunk that overlaps existing samples is written to new
+        buffers, so series and slices obtained earlier never change.
+
+        With `DuplicatePolicy.MEAN`, duplicates within the chunk are averaged
+        first and the result is then averaged with the stored value at the
+        same x, which holds no count of the samples behind it. The result
+        thus depends on how samples are split across appends (e.g. 0 at x=5,
+        then 1 and 2 at x=5, gives 0.75, not 1); append all samples of an x
+        at once, or build the signal in one go, for the plain mean.
+        """
+        n = len(self.series)
+        if x is None:
+            if self.x_as_datetime:
+                raise ValueError("`x` is required when appending to a datetime signal.")
+            x = np.arange(n, n + len(y))  # type: ignore[arg-type]
+        chunk = Signal(
+            y,
+            x=x,
+            x_as_datetime=self.x_as_datetime,
+            datetime_format=datetime_format,
+            y_lbl=self.y_lbl,
+            cfg=self.cfg,
+        ).series
+        if len(chunk) == 0:
+            return
+        if not (_is_bufferable(self.series) and _is_bufferable(chunk)):
+            self.series = _preprocess_series(
+                pd.concat([self.series, chunk.rename(self.series.name)]), self.cfg
+            )
+            return
+
+        # (Re)build the buffers if the series was replaced since the last append
+        if self._buffered_series is not self.series:
+            self._values_buf = GrowableArray.from_array(self.series.to_numpy())
+            self._index_buf = GrowableArray.from_array(self.series.index.to_numpy())
+            self._x_sorted = self.series.index.is_monotonic_increasing
+        values_buf, index_buf = self._values_buf, self._index_buf
+        assert values_buf is not None and index_buf is not None
+        values_buf.astype(np.result_type(values_buf.dtype, chunk.dtype))
+        index_buf.astype(np.result_type(index_buf.dtype, chunk.index.dtype))
+
+        # Only samples with x >= min(chunk x) can clash with the chunk
+        x_old = index_buf.data
+        x_chunk = chunk.index.to_numpy().astype(index_buf.dtype)
+        chunk_sorted = chunk.index.is_monotonic_increasing
+        x_min = x_chunk[0] if chunk_sorted else x_chunk.min()
+        start = np.searchsorted(x_old, x_min, side="left") if self._x_sorted else 0
+        if start == n:
+            merged, x_merged = chunk, x_chunk
+            x_sorted = self._x_sorted and chunk_sorted
+        else:
+            tail = pd.Series(
+                values_buf.data[start:], index=pd.Index(x_old[start:]), copy=False
+            )
+            merged = _preprocess_series(pd.concat([tail, chunk]), self.cfg)
+            x_merged = merged.index.to_numpy().astype(x_old.dtype)
+            x_sorted = merged.index.is_monotonic_increasing and (
+                start == 0 or x_old[start - 1] < x_merged[0]
+            )
+
+            # Earlier series are views of the buffers: copy the rows kept
+            # instead of overwriting the rest in place
+            values_buf = GrowableArray.from_array(
+                values_buf.data[:start], capacity=values_buf.capacity
+            )
+            index_buf = GrowableArray.from_array(
+                x_old[:start], capacity=index_buf.capacity
+            )
+            self._values_buf, self._index_buf = values_buf, index_buf
+        values_buf.write(start, merged.to_numpy(dtype=values_buf.dtype))
+        index_buf.write(start, x_merged)
+
+        # Expose the filled part of the buffers as the signal's series
+        self.series = pd.Series(
+            values_buf.data,
+            index=pd.Index(index_buf.data, copy=False),
+            name=self.series.name,
+            copy=False,
+        )
+        self._buffered_series = self.series
+        self._x_sorted = x_sorted
+
+    def interpolate(
+        self,
+        min_res: Optional[float | str] = 1,
+        method: InterpolateOptions = "linear",
+        order: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ):
+        """
+        Interpolate signal Series on intermittent time points, distributed
+        at given `freq`. Linear, nearest, slinear, quadratic and cubic methods
+        are evaluated directly from the original samples (see
+        `resampling.resample`), `chunk_size` points at a time if given so that
+        memory-mapped signals (see `open`) are read piece by piece; other
+        pandas methods go through `reindex` + `pd.Series.interpolate`.
+        """
+        # Create a new index with new times to be interpolated
+        new_index = _interpolation_index(self.series.index, self.x_as_datetime, min_res)
+
+        if method not in RESAMPLE_METHODS:
+            # Reindex the series after adding the new index (pd.Series.reindex)
+            self.series = self.series.reindex(new_index)
+
+            # Interpolate the series and replace NaNs (pd.Series.interpolate)
+            self.series.interpolate(method=method, inplace=True, order=order)
+            return
+
+        # Resample the (sorted, non-missing) samples onto the new index
+        kind, k = RESAMPLE_METHODS[method]
+        series = self.series
+        if series.hasnans:
+            series = series.dropna()
+        if not series.index.is_monotonic_increasing:
+            series = series.sort_index(kind="stable")
+        y = series.to_numpy(copy=False)
+        if y.dtype.kind not in "biuf":
+            y = series.to_numpy(dtype=float)
+        values = _resample(
+            to_numeric_axis(series.index),
+            y,
+            to_numeric_axis(new_index),
+            method=kind,
+            order=k,
+            chunk_size=chunk_size,
+        )
+        self.series = pd.Series(
+            values, index=new_index, name=self.series.name, copy=False
+        )
 
-        # Sort along x
-        if cfg.sort_x:
-            self.series.sort_index(inplace=True)
+
+class SignalSet:
+    """
+    Multi-channel signal: one shared x index plus a contiguous 2-D float
+    array of shape (n_samples, n_channels).
+    """
+
+    x: pd.Index
+    values: np.ndarray
+
+    def __init__(
+        self,
+        values: np.ndarray | pd.DataFrame,
+        x: Optional[abc.Iterable] = None,
+        x_as_datetime: bool = False,
+        datetime_format: Optional[str] = None,
+        y_lbls: Optional[list] = None,
+        x_lbl: Optional[str] = None,
+        cfg: PreprocessConfig = PreprocessConfig(),
+    ) -> None:
+        """
+        Initialize the SignalSet object. Each column of `values` is a channel.
+        """
+        if isinstance(values, pd.DataFrame):
+            if y_lbls is None:
+                y_lbls = list(values.columns)
+            if x is None:
+                x = values.index
+            values = values.to_numpy(dtype=float)
+        values = np.asarray(values, dtype=float)
+        if values.ndim == 1:
+            values = values.reshape(-1, 1)
+        elif values.ndim != 2:
+            raise ValueError(f"Expected 1-D or 2-D values, got {values.ndim}-D")
+
+        # Store x as a shared index and y as a contiguous 2-D array
+        self.x_as_datetime = x_as_datetime
+        if x is None:
+            self.x = pd.RangeIndex(values.shape[0])
+        else:
+            self.x = _as_index(
+                x, as_datetime=x_as_datetime, datetime_format=datetime_format
+            )
+        if len(self.x) != values.shape[0]:
+            raise ValueError(
+                f"Length of x ({len(self.x)}) does not match number of samples ({values.shape[0]})"
+            )
+        self.values = np.ascontiguousarray(values)
+
+        # Store other init args in SignalSet obj
+        self.y_lbls = (
+            list(y_lbls) if y_lbls is not None else list(range(values.shape[1]))
+        )
+        if len(self.y_lbls) != values.shape[1]:
+            raise ValueError(
+                f"Got {len(self.y_lbls)} label(s) for {values.shape[1]} channel(s)"
+            )
+        self.x_lbl = x_lbl
+        self.cfg = cfg
+
+        # Preprocess all channels as per given config
+        self.preprocess(cfg)
+
+    @classmethod
+    def from_signals(
+        cls,
+        signals: list[Signal],
+        x_lbl: Optional[str] = None,
+        cfg: PreprocessConfig = PreprocessConfig(),
+    ):
+        """
+        Stack single-channel signals into one SignalSet, aligned on the union
+        of their x (missing samples are NaN).
+        """
+        df = pd.concat([s.series for s in signals], axis=1)
+        return cls(
+            df.to_numpy(dtype=float),
+            x=df.index,
+            x_as_datetime=all(s.x_as_datetime for s in signals),
+            y_lbls=[s.y_lbl for s in signals],
+            x_lbl=x_lbl if x_lbl is not None else signals[0].x_lbl,
+            cfg=cfg,
+        )
+
+    @classmethod
+    def from_spreadsheet_file(
+        cls,
+        fpath: str,
+        cols_y: list[str],
+        col_x: Optional[str] = None,
+        x_as_datetime: bool = False,
+        datetime_format: Optional[str] = None,
+        cfg: PreprocessConfig = PreprocessConfig(),
+    ):
+        # Use appropriate func to read spreadsheet based on file ext
+        _, file_ext = os.path.splitext(fpath)
+        usecols = cols_y + [col_x] if col_x is not None else cols_y
+        if file_ext == ".xlsx":
+            df = pd.read_excel(fpath, usecols=usecols)
+        elif file_ext == ".csv":
+            df = pd.read_csv(fpath, usecols=usecols)
+        else:
+            raise ValueError(f"Unknown file extension {file_ext} in {fpath}")
+
+        return cls(
+            df[cols_y].to_numpy(dtype=float),
+            x=df[col_x] if col_x is not None else None,
+            x_as_datetime=x_as_datetime,
+            datetime_format=datetime_format,
+            y_lbls=cols_y,
+            x_lbl=col_x,
+            cfg=cfg,
+        )
+
+    @property
+    def n_channels(self) -> int:
+        return self.values.shape[1]
+
+    def __len__(self) -> int:
+        return self.values.shape[0]
+
+    def __getitem__(self, y_lbl) -> Signal:
+        """
+        Return channel `y_lbl` as a Signal sharing memory with this set.
+        """
+        try:
+            i_ch = self.y_lbls.index(y_lbl)
+        except ValueError:
+            raise KeyError(f"No channel labelled {y_lbl!r}") from None
+        series = pd.Series(self.values[:, i_ch], index=self.x, name=y_lbl, copy=False)
+        return Signal.from_series(
+            series, x_as_datetime=self.x_as_datetime, x_lbl=self.x_lbl, cfg=self.cfg
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.values, index=self.x, columns=self.y_lbls, copy=False)
+
+    def preprocess(self, cfg: PreprocessConfig):
+
+        # Sort along x (one argsort shared by all channels)
+        if cfg.sort_x and not self.x.is_monotonic_increasing:
+            order = self.x.argsort(kind="stable")
+            self.x = self.x[order]
+            self.values = self.values[order]
 
         # Handle duplicates in y
         if cfg.duplicates != DuplicatePolicy.ERROR:
             if (cfg.duplicates == DuplicatePolicy.FIRST) or (
                 cfg.duplicates == DuplicatePolicy.LAST
             ):
-                mask_duplicated = self.series.index.duplicated(
-                    keep=cfg.duplicates.value
-                )
-                self.series = self.series.loc[~mask_duplicated]
+                mask_duplicated = self.x.duplicated(keep=cfg.duplicates.value)
+                if mask_duplicated.any():
+                    self.x = self.x[~mask_duplicated]
+                    self.values = self.values[~mask_duplicated]
             elif cfg.duplicates == DuplicatePolicy.MEAN:
-                self.series = cast(pd.Series, self.series.groupby(level=0).mean())
+                self.x, self.values = _mean_over_duplicates(self.x, self.values)
         else:
-            mask_duplicated = self.series.index.duplicated()
-            if sum(mask_duplicated) > 0:
+            if self.x.has_duplicates:
                 raise ValueError(
                     "Duplicate indices found! Set duplicates policy to 'first', 'last', or 'mean'"
                 )
@@ -149,27 +622,157 @@ class Signal:
         min_res: Optional[float | str] = 1,
         method: InterpolateOptions = "linear",
         order: Optional[int] = None,
+        chunk_size: Optional[int] = None,
     ):
         """
-        Interpolate signal Series on intermittent time points, distributed
-        at given `freq`.
+        Interpolate all channels on intermittent time points, distributed
+        at given `freq`. Channels without missing samples share a single
+        resampling pass (see `Signal.interpolate` for the supported methods
+        and `chunk_size`).
         """
-        # Create a new index with new times to be interpolated
-        if self.x_as_datetime:
-            new_index = pd.date_range(
-                start=self.series.index.min(), end=self.series.index.max(), freq=min_res
-            )
+        new_index = _interpolation_index(self.x, self.x_as_datetime, min_res)
+
+        if method not in RESAMPLE_METHODS:
+            df = self.to_frame().reindex(new_index)
+            df.interpolate(method=method, inplace=True, order=order)
+            self.x = new_index
+            self.values = np.ascontiguousarray(df.to_numpy(dtype=float))
+            return
+
+        kind, k = RESAMPLE_METHODS[method]
+        x, values = self.x, self.values
+        if not x.is_monotonic_increasing:
+            sort_order = x.argsort(kind="stable")
+            x, values = x[sort_order], values[sort_order]
+        x_num, grid = to_numeric_axis(x), to_numeric_axis(new_index)
+
+        # Resample all complete channels at once, then any channel with NaNs on its own
+        out = np.empty((len(new_index), self.n_channels))
+        mask_nan = np.isnan(values)
+        complete = ~mask_nan.any(axis=0)
+        if complete.all():
+            _resample(x_num, values, grid, kind, k, out=out, chunk_size=chunk_size)
         else:
-            new_index = pd.Index(
-                np.arange(
-                    self.series.index.to_series().iloc[0],
-                    self.series.index.to_series().iloc[-1] + min_res,
-                    min_res,
+            if complete.any():
+                out[:, complete] = _resample(
+                    x_num, values[:, complete], grid, kind, k, chunk_size=chunk_size
                 )
+            for i_ch in np.flatnonzero(~complete):
+                valid = ~mask_nan[:, i_ch]
+                if not valid.any():
+                    out[:, i_ch] = np.nan
+                    continue
+                _resample(
+                    x_num[valid],
+                    values[valid, i_ch],
+                    grid,
+                    kind,
+                    k,
+                    out=out[:, i_ch],
+                    chunk_size=chunk_size,
+                )
+        self.x = new_index
+        self.values = out
+
+
+def _preprocess_series(series: pd.Series, cfg: PreprocessConfig) -> pd.Series:
+    """
+    Sort and/or de-duplicate `series` along its index as per `cfg`.
+    """
+    # Sort along x (stable, so 'first'/'last' follow the input order)
+    if cfg.sort_x:
+        series = series.sort_index(kind="stable")
+
+    # Handle duplicates in y
+    if cfg.duplicates != DuplicatePolicy.ERROR:
+        if (cfg.duplicates == DuplicatePolicy.FIRST) or (
+            cfg.duplicates == DuplicatePolicy.LAST
+        ):
+            mask_duplicated = series.index.duplicated(keep=cfg.duplicates.value)
+            series = series.loc[~mask_duplicated]
+        elif cfg.duplicates == DuplicatePolicy.MEAN:
+            series = cast(pd.Series, series.groupby(level=0).mean())
+    else:
+        if series.index.has_duplicates:
+            raise ValueError(
+                "Duplicate indices found! Set duplicates policy to 'first', 'last', or 'mean'"
             )
+    return series
+
+
+def _save_atomic(fpath: str, write) -> None:
+    """
+    Call `write` on a temporary binary file, then move it to `fpath`.
+    """
+    with open(fpath + ".tmp", "wb") as f:
+        write(f)
+    os.replace(fpath + ".tmp", fpath)
+
+
+def _is_bufferable(series: pd.Series) -> bool:
+    """
+    Whether values and x of `series` are plain NumPy arrays (see `Signal.append`).
+    """
+    return (
+        isinstance(series.dtype, np.dtype)
+        and series.dtype != object
+        and isinstance(series.index.dtype, np.dtype)
+        and series.index.dtype != object
+    )
+
+
+def _resample(
+    x: np.ndarray,
+    y: np.ndarray,
+    grid: np.ndarray,
+    method: str,
+    order: Optional[int],
+    out: Optional[np.ndarray] = None,
+    chunk_size: Optional[int] = None,
+) -> np.ndarray:
+    """
+    `resampling.resample`, or `resampling.resample_chunked` if `chunk_size`
+    is given.
+    """
+    if chunk_size is None:
+        return resample(x, y, grid, method=method, order=order, out=out)
+    return resample_chunked(
+        x, y, grid, method=method, order=order, out=out, chunk_size=chunk_size
+    )
+
+
+def _interpolation_index(
+    index: pd.Index, x_as_datetime: bool, min_res: Optional[float | str]
+) -> pd.Index:
+    """
+    Evenly spaced index spanning `index` at resolution `min_res`.
+    """
+    if x_as_datetime:
+        return pd.date_range(start=index.min(), end=index.max(), freq=min_res)
+    return pd.Index(np.arange(index[0], index[-1] + min_res, min_res))
 
-        # Reindex the series after adding the new index (pd.Series.reindex)
-        self.series = self.series.reindex(new_index)
 
-        # Interpolate the series and replace NaNs (pd.Series.interpolate)
-        self.series.interpolate(method=method, inplace=True, order=order)
+def _mean_over_duplicates(
+    x: pd.Index, values: np.ndarray
+) -> tuple[pd.Index, np.ndarray]:
+    """
+    Average rows of `values` sharing the same x (ignoring NaNs, as in
+    `groupby(...).mean()`); the result is sorted along x. As in groupby,
+    rows with a missing x are dropped.
+    """
+    codes, uniques = pd.factorize(x, sort=True)
+    if (codes == -1).any():
+        keep = codes != -1
+        codes, values = codes[keep], values[keep]
+    if len(uniques) == len(codes):
+        order = np.argsort(codes)
+        return pd.Index(uniques), values[order]
+    order = np.argsort(codes, kind="stable")
+    starts = np.flatnonzero(np.r_[True, np.diff(codes[order]) != 0])
+    grouped = values[order]
+    valid = ~np.isnan(grouped)
+    sums = np.add.reduceat(np.where(valid, grouped, 0.0), starts, axis=0)
+    counts = np.add.reduceat(valid, starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    return pd.Index(uniques), means
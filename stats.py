@@ -1,6 +1,3 @@
-import pingouin as pg
-from scipy import stats
-
 from .base import PairedAnalyzer, SingleDataAnalyzer
 from .data import DataContainer
 from .utils.helpers import test_difference_wilcoxon, test_normality_shapirowilk
@@ -78,6 +75,8 @@ class StatisticalAnalyzer(SingleDataAnalyzer):
             method = "Pearson"
 
         # Calculate corr coef
+        from scipy import stats
+
         if method == "Spearman":
             corr, pval = stats.spearmanr(self.df[col1], self.df[col2])
         elif method == "Pearson":
@@ -101,6 +100,8 @@ class StatisticalAnalyzer(SingleDataAnalyzer):
         controlling for `cols_covar`, using `method` method. The alternative hypothesis to
         be used by pingouin.partial_corr is specified by `alternative` (default: "two-sided").
         """
+        import pingouin as pg
+
         results = pg.partial_corr(
             data=self.df,
             x=col1,
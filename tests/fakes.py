@@ -0,0 +1,43 @@
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+
+class FakeProvider:
+    """
+    Offline `DataProvider` with deterministic business-day bars. Records every
+    call, and can fail a ticker a given number of times (-1 for always) or
+    delay its responses.
+    """
+
+    def __init__(self, failures: dict = {}, delays: dict = {}) -> None:
+        self.failures = dict(failures)
+        self.delays = dict(delays)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def fetch(self, ticker, start, end, interval):
+        with self._lock:
+            self.calls.append((ticker, start, end))
+            n_failures = self.failures.get(ticker, 0)
+            if n_failures > 0:
+                self.failures[ticker] = n_failures - 1
+        time.sleep(self.delays.get(ticker, 0.0))
+        if n_failures != 0:
+            raise ConnectionError(f"Could not fetch '{ticker}'")
+        return bars(ticker, start, end)
+
+
+def bars(ticker, start, end) -> pd.DataFrame:
+    """
+    Business-day bars of `ticker` with `start` <= date < `end`; prices depend
+    only on the ticker and date, so refetched bars are identical.
+    """
+    index = pd.bdate_range(
+        start if start is not None else "2020-01-01", end, inclusive="left"
+    )
+    days = (index - pd.Timestamp("2020-01-01")).days.to_numpy()
+    close = 10.0 * len(ticker) + 50.0 + np.sin(days / 7.0) + 0.01 * days
+    return pd.DataFrame({"Close": close, "Volume": 1000.0 + days}, index=index)
@@ -0,0 +1,101 @@
+import time
+
+import pandas as pd
+import pytest
+
+from analyzer.fetching import FetchScheduler, TokenBucket
+from analyzer.finance import FinanceDataAnalyzer, YahooProvider
+
+from .fakes import FakeProvider, bars
+
+START, END = pd.Timestamp("2024-01-01"), pd.Timestamp("2024-02-01")
+
+
+def test_fetch_retries_until_success():
+    provider = FakeProvider(failures={"AAA": 2})
+    scheduler = FetchScheduler(provider, max_attempts=3, backoff=0.01)
+    result = scheduler.fetch("AAA", START, END, "1d")
+    assert result.error is None
+    assert result.attempts == 3
+    assert len(result.data) == 23
+
+
+def test_fetch_gives_up_after_max_attempts():
+    provider = FakeProvider(failures={"AAA": -1})
+    scheduler = FetchScheduler(provider, max_attempts=2, backoff=0.01)
+    result = scheduler.fetch("AAA", START, END, "1d")
+    assert isinstance(result.error, ConnectionError)
+    assert result.attempts == 2 and result.data is None
+    assert len(provider.calls) == 2
+
+
+def test_fetch_all_runs_tasks_concurrently():
+    tickers = [f"T{i}" for i in range(8)]
+    provider = FakeProvider(delays={ticker: 0.2 for ticker in tickers})
+    scheduler = FetchScheduler(provider, max_workers=8)
+    t_start = time.perf_counter()
+    results = list(scheduler.fetch_all([(t, START, END) for t in tickers], "1d"))
+    assert time.perf_counter() - t_start < 1.0
+    assert sorted(result.ticker for result in results) == tickers
+
+
+def test_token_bucket_limits_rate():
+    bucket = TokenBucket(rate=20.0, capacity=1.0)
+    t_start = time.perf_counter()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.perf_counter() - t_start >= 0.2
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0.0)
+
+
+def test_yahoo_failures_are_retried(monkeypatch):
+    yf = pytest.importorskip("yfinance")
+    responses = [pd.DataFrame(), bars("AAA", START, END)]
+    monkeypatch.setattr(yf, "download", lambda *args, **kwargs: responses.pop(0))
+    scheduler = FetchScheduler(YahooProvider(), backoff=0.01)
+    result = scheduler.fetch("AAA", START, END, "1d")
+    assert result.error is None and result.attempts == 2
+    assert len(result.data) == 23
+
+
+def test_iter_download_streams_tickers_as_they_complete(tmp_path):
+    provider = FakeProvider(delays={"SLOW": 0.3})
+    anal = FinanceDataAnalyzer(
+        str(tmp_path), str(tmp_path), ["SLOW", "FAST"], provider=provider
+    )
+    streamed = [ticker for ticker, _ in anal.iter_download(start=START, end=END)]
+    assert streamed == ["FAST", "SLOW"]
+
+    # Up-to-date tickers are served from the store first, then fetched ones
+    anal.tickers = ["SLOW", "NEW", "FAST"]
+    last_bar = pd.Timestamp("2024-01-31")
+    streamed = [t for t, _ in anal.iter_download(start=START, end=last_bar)]
+    assert streamed == ["SLOW", "FAST", "NEW"]
+
+
+def test_permanently_failing_ticker_does_not_block_others(tmp_path):
+    provider = FakeProvider(failures={"BAD": -1})
+    anal = FinanceDataAnalyzer(
+        str(tmp_path),
+        str(tmp_path),
+        ["BAD", "GOOD"],
+        provider=provider,
+        fetch_opts={"max_attempts": 2, "backoff": 0.01},
+    )
+    streamed = dict(anal.iter_download(start=START, end=END))
+    assert list(streamed) == ["GOOD"]
+    assert len(streamed["GOOD"]) == 23
+    assert isinstance(anal.failed_tickers["BAD"], ConnectionError)
+    assert anal.store.coverage("BAD", "1d") is None
+
+    # The failed range was not marked covered, so it is fetched again
+    provider.failures["BAD"] = 0
+    anal.download_data(start=START, end=END)
+    assert anal.failed_tickers == {}
+    assert list(anal.df.columns) == [
+        "Close_BAD",
+        "Close_GOOD",
+        "Volume_BAD",
+        "Volume_GOOD",
+    ]
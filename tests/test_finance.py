@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from analyzer.finance import FinanceDataAnalyzer, _resolve_date_range
+
+from .fakes import FakeProvider, bars
+
+
+def test_default_period_is_one_month():
+    start, end = _resolve_date_range(None, None, None)
+    assert end == pd.Timestamp.today().normalize() + pd.Timedelta(days=1)
+    assert start == end - pd.DateOffset(months=1)
+    assert _resolve_date_range("max", None, None)[0] is None
+    assert _resolve_date_range(None, None, "2024-02-01") == (
+        None,
+        pd.Timestamp("2024-02-01"),
+    )
+
+
+def test_load_data_reads_store_without_network(tmp_path):
+    offline = FakeProvider(failures={"AAA": -1, "BB": -1})
+    anal = FinanceDataAnalyzer(
+        str(tmp_path), str(tmp_path), ["AAA", "BB"], provider=offline
+    )
+    start, end = pd.Timestamp("2024-01-01"), pd.Timestamp("2024-02-01")
+    for ticker in anal.tickers:
+        anal.store.merge(ticker, "1d", bars(ticker, start, end), start, end)
+
+    df = anal.load_data(start=start, end=pd.Timestamp("2024-01-15"))
+    assert offline.calls == []
+    assert list(df.columns) == ["Close_AAA", "Close_BB", "Volume_AAA", "Volume_BB"]
+    assert df.index[0] == start and df.index[-1] == pd.Timestamp("2024-01-12")
+    pd.testing.assert_series_equal(
+        df["Close_BB"],
+        bars("BB", start, pd.Timestamp("2024-01-15"))["Close"],
+        check_names=False,
+        check_freq=False,
+    )
+
+
+def test_download_data_fetches_missing_ranges_only(tmp_path):
+    provider = FakeProvider()
+    anal = FinanceDataAnalyzer(str(tmp_path), str(tmp_path), ["AAA"], provider=provider)
+    anal.download_data(start="2024-01-01", end="2024-02-01")
+    assert len(anal.df) == 23
+    anal.download_data(start="2024-01-08", end="2024-02-01")
+    assert provider.calls[1:] == [
+        ("AAA", pd.Timestamp("2024-01-31"), pd.Timestamp("2024-02-01"))
+    ]
+    anal.download_data(start="2023-12-01", end="2024-02-01")
+    assert set(provider.calls[2:]) == {
+        ("AAA", pd.Timestamp("2023-12-01"), pd.Timestamp("2024-01-01")),
+        ("AAA", pd.Timestamp("2024-01-31"), pd.Timestamp("2024-02-01")),
+    }
+    assert anal.df.index[0] == pd.Timestamp("2023-12-01")
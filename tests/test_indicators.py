@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzer.finance import FinanceDataAnalyzer
+from analyzer.indicators import IndicatorEngine
+
+from .fakes import FakeProvider, bars
+
+
+def _market_frame(n: int = 300, tz=None) -> pd.DataFrame:
+    """
+    `<field>_<ticker>` frame of random-walk prices with a few missing bars.
+    """
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2023-01-02", periods=n, freq="D", tz=tz)
+    df = pd.DataFrame(index=index)
+    for ticker in ["AAA", "BB", "C_D"]:
+        close = 100 * np.exp(np.cumsum(0.01 * rng.normal(size=n)))
+        close[rng.choice(n, 5, replace=False)] = np.nan
+        df[f"Close_{ticker}"] = close
+        df[f"Volume_{ticker}"] = rng.uniform(1e3, 1e4, n)
+    return df
+
+
+def _close(df: pd.DataFrame) -> pd.DataFrame:
+    close = df[[col for col in df.columns if col.startswith("Close_")]]
+    return close.rename(columns=lambda col: col.split("_", 1)[1])
+
+
+@pytest.mark.parametrize("window", [1, 5, 20])
+def test_rolling_statistics_match_pandas(window):
+    df = _market_frame()
+    engine = IndicatorEngine(df)
+    close = _close(df)
+    np.testing.assert_allclose(
+        engine.rolling_mean(window),
+        close.rolling(window).mean().to_numpy().T,
+        rtol=1e-12,
+    )
+    np.testing.assert_allclose(
+        engine.rolling_std(window),
+        close.rolling(window).std().to_numpy().T,
+        rtol=1e-9,
+        atol=1e-12,
+    )
+    rets = close / close.shift(1) - 1
+    np.testing.assert_allclose(
+        engine.rolling_mean(window, source="returns"),
+        rets.rolling(window).mean().to_numpy().T,
+        atol=1e-13,
+    )
+
+
+def test_returns_and_volatility_match_pandas():
+    df = _market_frame()
+    engine = IndicatorEngine(df)
+    close = _close(df)
+    np.testing.assert_allclose(
+        engine.returns(), (close / close.shift(1) - 1).to_numpy().T, atol=1e-13
+    )
+    log_rets = np.log(close / close.shift(1))
+    np.testing.assert_allclose(
+        engine.volatility(10),
+        (log_rets.rolling(10).std() * np.sqrt(252)).to_numpy().T,
+        atol=1e-12,
+    )
+    assert list(engine.to_frame(engine.returns()).columns) == ["AAA", "BB", "C_D"]
+
+
+def test_incremental_update_matches_full_build():
+    df = _market_frame()
+    engine = IndicatorEngine(df.iloc[:200])
+    engine.rolling_std(10)  # cache running sums before updating
+    engine.rolling_mean(5, source="log_returns")
+    engine.update(df.iloc[150:250])
+    engine.update(df.iloc[250:])
+
+    full = IndicatorEngine(df)
+    assert engine.dates.equals(full.dates)
+    np.testing.assert_allclose(engine.rolling_std(10), full.rolling_std(10), atol=1e-10)
+    np.testing.assert_allclose(
+        engine.rolling_mean(5, source="log_returns"),
+        full.rolling_mean(5, source="log_returns"),
+        atol=1e-12,
+    )
+
+
+def test_update_keeps_timezone():
+    df = _market_frame(tz="America/New_York")
+    engine = IndicatorEngine(df.iloc[:100])
+    engine.update(df.iloc[100:])
+    assert engine.dates.equals(df.index)
+    with pytest.raises(ValueError):
+        engine.update(_market_frame().iloc[-5:])
+
+
+def test_rolling_std_is_nan_without_enough_values():
+    engine = IndicatorEngine(_market_frame())
+    assert np.isnan(engine.rolling_std(1)).all()
+    assert not np.isnan(engine.rolling_std(1, ddof=0)[:, 10:20]).any()
+    with pytest.raises(ValueError):
+        engine.rolling_mean(0)
+
+
+def test_engine_recovers_from_failed_and_empty_downloads(tmp_path):
+    provider = FakeProvider(failures={"AAA": -1, "BBB": -1})
+    anal = FinanceDataAnalyzer(
+        str(tmp_path),
+        str(tmp_path),
+        ["AAA", "BBB"],
+        provider=provider,
+        fetch_opts={"max_attempts": 1},
+    )
+    anal.download_data(start="2024-01-01", end="2024-02-01")
+    assert len(anal.df) == 0
+    assert len(anal.indicator_engine().dates) == 0
+
+    # AAA recovers first, then BBB; the engine follows the new columns
+    provider.failures["AAA"] = 0
+    anal.download_data(start="2024-01-01", end="2024-02-01")
+    assert anal.indicator_engine().tickers == ["AAA"]
+    provider.failures["BBB"] = 0
+    anal.download_data(start="2024-01-01", end="2024-03-01")
+    engine = anal.indicator_engine()
+    assert engine.tickers == ["AAA", "BBB"]
+    assert engine.dates.equals(anal.df.index)
+
+    # Newer bars are added incrementally, backfilled ones rebuild the engine
+    anal.download_data(start="2024-01-01", end="2024-03-15")
+    assert anal.indicator_engine() is engine
+    assert engine.dates[-1] == pd.Timestamp("2024-03-14")
+    anal.download_data(start="2023-12-01", end="2024-03-15")
+    assert anal.indicator_engine() is not engine
+    assert anal.indicators.dates[0] == pd.Timestamp("2023-12-01")
+    np.testing.assert_allclose(
+        anal.indicators.field("Close")[1],
+        bars("BBB", pd.Timestamp("2023-12-01"), pd.Timestamp("2024-03-15"))["Close"],
+    )
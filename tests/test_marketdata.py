@@ -0,0 +1,83 @@
+import pandas as pd
+import pytest
+
+from analyzer.marketdata import MarketDataStore
+
+from .fakes import bars
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MarketDataStore(str(tmp_path))
+
+
+def ts(date):
+    return pd.Timestamp(date)
+
+
+def test_missing_intervals_of_empty_store(store):
+    assert store.missing_intervals("AAA", "1d", ts("2024-01-01"), ts("2024-02-01")) == [
+        (ts("2024-01-01"), ts("2024-02-01"))
+    ]
+    assert store.missing_intervals("AAA", "1d", None, ts("2024-02-01")) == [
+        (None, ts("2024-02-01"))
+    ]
+
+
+def test_missing_intervals_around_coverage(store):
+    start, end = ts("2024-01-01"), ts("2024-02-01")
+    store.merge("AAA", "1d", bars("AAA", start, end), start, end)
+    cov_start, cov_end = store.coverage("AAA", "1d")
+    assert cov_start == start
+    assert cov_end == ts("2024-01-31")  # last bar received
+    assert (
+        store.missing_intervals("AAA", "1d", ts("2024-01-08"), ts("2024-01-20")) == []
+    )
+    assert store.missing_intervals("AAA", "1d", ts("2023-12-01"), ts("2024-03-01")) == [
+        (ts("2023-12-01"), start),
+        (cov_end, ts("2024-03-01")),
+    ]
+    assert store.missing_intervals("AAA", "1d", None, end)[0] == (None, start)
+
+
+def test_merge_replaces_overlapping_bars(store):
+    start, end = ts("2024-01-01"), ts("2024-02-01")
+    store.merge("AAA", "1d", bars("AAA", start, end), start, end)
+    update = bars("AAA", ts("2024-01-29"), ts("2024-02-10")) * 2
+    store.merge("AAA", "1d", update, ts("2024-01-29"), ts("2024-02-10"))
+
+    df = store.read("AAA", "1d")
+    assert df.index.is_unique and df.index.is_monotonic_increasing
+    assert df.index[0] == ts("2024-01-01") and df.index[-1] == ts("2024-02-09")
+    pd.testing.assert_frame_equal(df.loc["2024-01-29":], update, check_freq=False)
+    assert store.coverage("AAA", "1d") == (start, ts("2024-02-09"))
+    assert len(store.read("AAA", "1d", ts("2024-01-10"), ts("2024-01-13"))) == 3
+
+
+def test_merge_of_empty_frame_keeps_coverage(store):
+    start, end = ts("2024-01-01"), ts("2024-02-01")
+    store.merge("AAA", "1d", pd.DataFrame(), start, end)
+    assert store.coverage("AAA", "1d") is None
+    assert len(store.read("AAA", "1d")) == 0
+
+    store.merge("AAA", "1d", bars("AAA", start, end), start, end)
+    store.merge("AAA", "1d", pd.DataFrame(), end, ts("2024-03-01"))
+    assert store.coverage("AAA", "1d") == (start, ts("2024-01-31"))
+
+
+def test_todays_bar_is_left_open(store):
+    start, end = ts("2024-01-01"), ts("2024-02-01")
+    today = ts("2024-01-31")
+    store.merge("AAA", "1d", bars("AAA", start, end), start, end, complete_before=today)
+    assert store.read("AAA", "1d").index[-1] == today
+    assert store.coverage("AAA", "1d") == (start, today)
+    assert store.missing_intervals("AAA", "1d", start, end) == [(today, end)]
+
+
+def test_coverage_is_per_ticker_and_interval(store):
+    start, end = ts("2024-01-01"), ts("2024-02-01")
+    store.merge("AAA", "1d", bars("AAA", start, end), start, end)
+    store.merge("B/C", "1d", bars("B/C", start, end), start, end)
+    assert store.coverage("B/C", "1d") == (start, ts("2024-01-31"))
+    assert store.coverage("AAA", "1wk") is None
+    assert len(store.read("B/C", "1d")) == len(store.read("AAA", "1d"))
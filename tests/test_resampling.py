@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzer.resampling import resample, resample_chunked
+from analyzer.signals import Signal, SignalSet
+
+METHODS = ["linear", "nearest", "slinear", "quadratic", "cubic"]
+
+
+def _pandas_interpolate(series: pd.Series, new_index, method: str) -> pd.Series:
+    """
+    Interpolation through reindex + `pd.Series.interpolate`, as done before
+    the resampler was added.
+    """
+    return series.reindex(new_index).interpolate(method=method)
+
+
+def _irregular_samples(n: int = 500, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    x = np.cumsum(rng.uniform(0.5, 1.5, n))
+    return x, np.sin(x / 10) + 0.1 * rng.normal(size=n)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_interpolate_matches_pandas(method):
+    x = np.arange(200.0)
+    y = np.sin(x / 10) + 0.1 * np.random.default_rng(0).normal(size=200)
+    sig = Signal(y, x=x)
+    sig.interpolate(min_res=0.5, method=method)
+    expected = _pandas_interpolate(pd.Series(y, index=x), sig.series.index, method)
+    np.testing.assert_allclose(sig.series.to_numpy(), expected.to_numpy(), atol=1e-10)
+
+
+def test_interpolate_datetime_matches_pandas():
+    x = pd.date_range("2024-01-01", periods=100, freq="s")
+    y = np.cos(np.arange(100) / 5)
+    sig = Signal(y, x=x, x_as_datetime=True)
+    sig.interpolate(min_res="250ms", method="time")
+    expected = _pandas_interpolate(pd.Series(y, index=x), sig.series.index, "time")
+    assert sig.series.index[1] - sig.series.index[0] == pd.Timedelta("250ms")
+    np.testing.assert_allclose(sig.series.to_numpy(), expected.to_numpy(), atol=1e-12)
+
+
+@pytest.mark.parametrize("method", ["linear", "nearest", "cubic"])
+def test_interpolate_integer_signal(method):
+    y = np.array([1, 2, 4, 8, 16])
+    sig = Signal(y, x=np.arange(5))
+    sig.interpolate(0.5, method=method)
+    expected = _pandas_interpolate(
+        pd.Series(y, index=np.arange(5)), sig.series.index, method
+    )
+    np.testing.assert_allclose(sig.series.to_numpy(), expected.to_numpy(), atol=1e-12)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_chunked_matches_unchunked(method):
+    x, y = _irregular_samples()
+    sig, sig_chunked = Signal(y, x=x), Signal(y, x=x)
+    sig.interpolate(0.3, method=method)
+    sig_chunked.interpolate(0.3, method=method, chunk_size=37)
+    pd.testing.assert_series_equal(sig_chunked.series, sig.series, atol=1e-12)
+
+
+def test_chunked_signal_set_matches_unchunked():
+    x, y = _irregular_samples()
+    values = np.c_[y, 2 * y, np.where(x > 100, np.nan, y)]
+    signals, signals_chunked = SignalSet(values, x=x), SignalSet(values, x=x)
+    signals.interpolate(0.3)
+    signals_chunked.interpolate(0.3, chunk_size=50)
+    np.testing.assert_array_equal(signals_chunked.values, signals.values)
+
+
+def test_resample_edges_and_multichannel():
+    x = np.array([0.0, 1.0, 3.0])
+    y = np.array([[0.0, 1.0], [2.0, 1.0], [6.0, 1.0]])
+    grid = np.array([-1.0, 0.5, 2.0, 4.0])
+    out = resample(x, y, grid)
+    np.testing.assert_allclose(out[:, 0], [0.0, 1.0, 4.0, 6.0])
+    np.testing.assert_allclose(out[:, 1], 1.0)
+    np.testing.assert_allclose(resample_chunked(x, y, grid, chunk_size=1), out)
+    np.testing.assert_allclose(
+        resample(x, y[:, 0], grid, method="nearest"), [0.0, 0.0, 2.0, 6.0]
+    )
+    with pytest.raises(ValueError):
+        resample(x[:2], y, grid)
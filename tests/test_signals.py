@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzer.signals import DuplicatePolicy, PreprocessConfig, Signal
+
+
+def test_signal_shares_caller_buffers():
+    y, x = np.arange(5.0), np.arange(5) * 10
+    sig = Signal(y, x=x)
+    assert np.shares_memory(sig.series.to_numpy(), y)
+    assert np.shares_memory(sig.series.index.to_numpy(), x)
+    series = pd.Series(y, index=x, copy=False)
+    assert np.shares_memory(Signal.from_series(series).series.to_numpy(), y)
+
+
+@pytest.mark.parametrize(
+    "make_y",
+    [list, tuple, lambda values: (v for v in values), pd.Series, np.array],
+    ids=["list", "tuple", "generator", "series", "array"],
+)
+def test_signal_from_array_likes(make_y):
+    sig = Signal(make_y([1.0, 2.0, 3.0]), x=make_y([0, 2, 4]))
+    assert sig.series.tolist() == [1.0, 2.0, 3.0]
+    assert sig.series.index.tolist() == [0, 2, 4]
+    assert sig.series.dtype == np.float64
+
+
+def test_signal_with_string_datetimes():
+    x = ["03/01/2024 10:00", "03/01/2024 10:05", "04/01/2024 09:00"]
+    sig = Signal(
+        [1.0, 2.0, 3.0], x=x, x_as_datetime=True, datetime_format="%d/%m/%Y %H:%M"
+    )
+    assert isinstance(sig.series.index, pd.DatetimeIndex)
+    assert sig.series.index[2] == pd.Timestamp("2024-01-04 09:00")
+    sig.append([4.0], x=["05/01/2024 00:00"], datetime_format="%d/%m/%Y %H:%M")
+    assert sig.series.index[-1] == pd.Timestamp("2024-01-05")
+
+
+def test_concat_appends_right_to_left():
+    left, right = Signal([1.0, 2.0], x=[0, 1]), Signal([3.0], x=[5])
+    assert Signal.concat(left, right).series.index.tolist() == [0, 1, 2]
+    concatenated = Signal.concat(left, right, ignore_x=False)
+    assert concatenated.series.index.tolist() == [0, 1, 5]
+    assert left.series.tolist() == [1.0, 2.0]
+
+
+def _is_memory_mapped(arr: np.ndarray) -> bool:
+    while arr is not None:
+        if isinstance(arr, np.memmap):
+            return True
+        arr = arr.base
+    return False
+
+
+def test_append_overlap_keeps_earlier_series():
+    sig = Signal(
+        [1.0, 2.0, 3.0],
+        x=[0, 1, 2],
+        cfg=PreprocessConfig(duplicates=DuplicatePolicy.LAST),
+    )
+    sig.append([9.0], x=[3])
+    held = sig.series
+    sig.append([7.0], x=[3])
+    assert held.tolist() == [1.0, 2.0, 3.0, 9.0]
+    assert held.index.tolist() == [0, 1, 2, 3]
+    assert sig.series.tolist() == [1.0, 2.0, 3.0, 7.0]
+
+
+def test_append_overlap_keeps_earlier_slice():
+    sig = Signal(
+        [1.0, 2.0, 3.0, 4.0],
+        x=[0, 1, 2, 3],
+        cfg=PreprocessConfig(sort_x=True, duplicates=DuplicatePolicy.LAST),
+    )
+    sig.append([6.0], x=[4])
+    sliced = sig.slice_x(2, 3)
+    sig.append([5.0], x=[2])
+    assert sliced.series.tolist() == [3.0, 4.0]
+    assert sliced.series.index.tolist() == [2, 3]
+    assert sig.series.tolist() == [1.0, 2.0, 5.0, 4.0, 6.0]
+
+
+def test_append_mean_is_taken_per_append():
+    cfg = PreprocessConfig(sort_x=True, duplicates=DuplicatePolicy.MEAN)
+    sig = Signal([0.0], x=[5], cfg=cfg)
+    sig.append([1.0, 2.0], x=[5, 5])
+    assert sig.series.tolist() == [0.75]
+    assert Signal([0.0, 1.0, 2.0], x=[5, 5, 5], cfg=cfg).series.tolist() == [1.0]
+
+
+def test_append_without_x_to_datetime_signal():
+    sig = Signal([1.0, 2.0], x=["2024-01-01", "2024-01-02"], x_as_datetime=True)
+    with pytest.raises(ValueError):
+        sig.append([3.0])
+    sig.append([3.0], x=["2024-01-03"])
+    assert len(sig.series) == 3
+    assert np.isnan(sig.series.to_numpy()).sum() == 0
+
+
+def test_save_open_round_trip_with_range_index(tmp_path):
+    sig = Signal(np.arange(5.0), y_lbl="y", x_lbl="t")
+    sig.save(str(tmp_path / "sig"))
+    opened = Signal.open(str(tmp_path / "sig"))
+    assert isinstance(opened.series.index, pd.RangeIndex)
+    assert opened.series.tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert (opened.y_lbl, opened.x_lbl) == ("y", "t")
+    assert not (tmp_path / "sig" / "index.npy").exists()
+
+
+def test_save_open_round_trip_with_tz_aware_index(tmp_path):
+    x = pd.date_range("2024-03-30", periods=48, freq="h", tz="Europe/Amsterdam")
+    cfg = PreprocessConfig(sort_x=True, duplicates=DuplicatePolicy.MEAN)
+    sig = Signal(np.arange(48.0), x=x, x_as_datetime=True, cfg=cfg)
+    sig.save(str(tmp_path / "sig"))
+    opened = Signal.open(str(tmp_path / "sig"))
+    pd.testing.assert_series_equal(opened.series, sig.series, check_freq=False)
+    assert opened.x_as_datetime and opened.cfg == cfg
+    assert _is_memory_mapped(opened.series.to_numpy(copy=False))
+
+
+def test_save_back_to_opened_path(tmp_path):
+    path = str(tmp_path / "sig")
+    Signal(np.arange(100_000.0), x=np.arange(100_000) * 2).save(path)
+    opened = Signal.open(path)
+    opened.save(path)
+    reopened = Signal.open(path)
+    assert reopened.series.iloc[-1] == 99_999.0
+    assert reopened.series.index[-1] == 199_998
+    assert opened.series.iloc[-1] == 99_999.0
+
+
+def test_save_rejects_object_values(tmp_path):
+    with pytest.raises(ValueError):
+        Signal(["a", "b"]).save(str(tmp_path / "sig"))
+
+
+def test_slice_x_of_sorted_signal_is_a_view(tmp_path):
+    sig = Signal(
+        np.arange(10.0), x=np.arange(10) * 2.0, cfg=PreprocessConfig(sort_x=True)
+    )
+    sliced = sig.slice_x(3, 8)
+    assert sliced.series.index.tolist() == [4.0, 6.0, 8.0]
+    assert np.shares_memory(sliced.series.to_numpy(), sig.series.to_numpy())
+    assert sig.slice_x(end=2).series.tolist() == [0.0, 1.0]
+    assert sig.slice_x(start=17).series.tolist() == [9.0]
+
+    sig.save(str(tmp_path / "sig"))
+    opened = Signal.open(str(tmp_path / "sig"))
+    assert opened.slice_x(3, 8).series.tolist() == [2.0, 3.0, 4.0]
+
+
+def test_slice_x_of_datetime_and_unsorted_signals():
+    x = pd.date_range("2024-01-01", periods=6, freq="D")
+    sig = Signal(
+        np.arange(6.0), x=x, x_as_datetime=True, cfg=PreprocessConfig(sort_x=True)
+    )
+    assert sig.slice_x("2024-01-02", "2024-01-04").series.tolist() == [1.0, 2.0, 3.0]
+
+    unsorted = Signal([1.0, 2.0, 3.0], x=[0, 5, 2])
+    assert unsorted.slice_x(0, 5).series.tolist() == [1.0, 2.0]
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from analyzer.signals import DuplicatePolicy, PreprocessConfig, Signal, SignalSet
+
+X = [3, 1, 3, 0, 1, 2]
+VALUES = np.array(
+    [
+        [1.0, 10.0],
+        [2.0, np.nan],
+        [3.0, 30.0],
+        [4.0, 40.0],
+        [5.0, 50.0],
+        [np.nan, 60.0],
+    ]
+)
+
+
+@pytest.mark.parametrize(
+    "duplicates", [DuplicatePolicy.FIRST, DuplicatePolicy.LAST, DuplicatePolicy.MEAN]
+)
+def test_preprocess_matches_signal(duplicates):
+    cfg = PreprocessConfig(sort_x=True, duplicates=duplicates)
+    signals = SignalSet(VALUES, x=X, y_lbls=["a", "b"], cfg=cfg)
+    assert signals.x.tolist() == [0, 1, 2, 3]
+    for i_ch, y_lbl in enumerate(["a", "b"]):
+        expected = Signal(VALUES[:, i_ch], x=X, cfg=cfg).series
+        np.testing.assert_array_equal(signals[y_lbl].series.to_numpy(), expected)
+        assert signals[y_lbl].series.index.equals(expected.index)
+
+
+def test_duplicates_raise_by_default():
+    with pytest.raises(ValueError):
+        SignalSet(VALUES, x=X)
+
+
+def test_mean_drops_missing_x():
+    cfg = PreprocessConfig(duplicates=DuplicatePolicy.MEAN)
+    values = [[1, 10], [2, 20], [3, 30], [3.5, np.nan]]
+    signals = SignalSet(values, x=[0, 0, np.nan, 2], cfg=cfg)
+    assert signals.x.tolist() == [0.0, 2.0]
+    np.testing.assert_array_equal(signals.values, [[1.5, 15.0], [3.5, np.nan]])
+
+
+def test_values_are_contiguous_and_shared_by_channels():
+    signals = SignalSet(pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0]}, index=[5, 6]))
+    assert signals.values.flags.c_contiguous
+    assert signals.y_lbls == ["a", "b"] and signals.x.tolist() == [5, 6]
+    assert (signals.n_channels, len(signals)) == (2, 2)
+    assert np.shares_memory(signals["b"].series.to_numpy(), signals.values)
+    with pytest.raises(KeyError):
+        signals["c"]
+
+
+def test_from_signals_aligns_on_union_of_x():
+    a = Signal([1.0, 2.0, 3.0], x=[0, 1, 2], y_lbl="a", x_lbl="t")
+    b = Signal([20.0, 30.0], x=[1, 3], y_lbl="b")
+    signals = SignalSet.from_signals([a, b])
+    assert signals.x.tolist() == [0, 1, 2, 3]
+    assert signals.y_lbls == ["a", "b"] and signals.x_lbl == "t"
+    np.testing.assert_array_equal(
+        signals.values,
+        [[1.0, np.nan], [2.0, 20.0], [3.0, np.nan], [np.nan, 30.0]],
+    )
+    pd.testing.assert_frame_equal(
+        signals.to_frame(), pd.concat([a.series, b.series], axis=1), check_dtype=False
+    )
+
+
+@pytest.mark.parametrize("method", ["linear", "nearest", "cubic"])
+def test_interpolate_with_nan_channels_matches_signal(method):
+    x = np.cumsum(np.random.default_rng(0).uniform(0.5, 1.5, 60))
+    y = np.sin(x / 5)
+    gappy = np.where((x > 10) & (x < 20), np.nan, y)
+    values = np.c_[y, gappy, np.full_like(y, np.nan)]
+    signals = SignalSet(values, x=x)
+    signals.interpolate(0.25, method=method)
+
+    for i_ch in range(2):
+        sig = Signal(values[:, i_ch], x=x)
+        sig.interpolate(0.25, method=method)
+        assert signals.x.equals(sig.series.index)
+        np.testing.assert_allclose(signals.values[:, i_ch], sig.series, atol=1e-12)
+    assert np.isnan(signals.values[:, 2]).all()
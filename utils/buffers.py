@@ -0,0 +1,84 @@
+import numpy as np
+
+
+class GrowableArray:
+    """
+    Array that grows along axis 0, doubling its capacity when full so that
+    repeated appends take amortized O(len(chunk)) time.
+    """
+
+    def __init__(self, dtype, shape_tail: tuple = (), capacity: int = 16) -> None:
+        self._buf = np.empty((max(capacity, 1),) + tuple(shape_tail), dtype=dtype)
+        self._size = 0
+
+    @classmethod
+    def from_array(cls, arr: np.ndarray, capacity: int = 0):
+        """
+        Create a buffer holding a copy of `arr`, with room for at least
+        `capacity` rows.
+        """
+        obj = cls(arr.dtype, arr.shape[1:], capacity=max(capacity, 2 * len(arr)))
+        obj.extend(arr)
+        return obj
+
+    @property
+    def data(self) -> np.ndarray:
+        """
+        View of the filled part of the buffer (invalidated by a reallocation).
+        """
+        return self._buf[: self._size]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._buf.dtype
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buf)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Make room for at least `capacity` rows, doubling the current capacity
+        as often as needed.
+        """
+        if capacity <= len(self._buf):
+            return
+        new_capacity = len(self._buf)
+        while new_capacity < capacity:
+            new_capacity *= 2
+        new_buf = np.empty((new_capacity,) + self._buf.shape[1:], dtype=self._buf.dtype)
+        new_buf[: self._size] = self._buf[: self._size]
+        self._buf = new_buf
+
+    def resize(self, size: int) -> None:
+        """
+        Set the number of filled rows; new rows are left uninitialized.
+        """
+        self.reserve(size)
+        self._size = size
+
+    def astype(self, dtype) -> None:
+        """
+        Cast the buffer (in place) to `dtype`.
+        """
+        if np.dtype(dtype) != self._buf.dtype:
+            self._buf = self._buf.astype(dtype)
+
+    def write(self, start: int, arr: np.ndarray) -> None:
+        """
+        Overwrite the buffer from row `start` on with `arr`, dropping any rows
+        after it.
+        """
+        if start > self._size:
+            raise IndexError(
+                f"Cannot write at row {start} of a buffer of size {self._size}"
+            )
+        self.reserve(start + len(arr))
+        self._buf[start : start + len(arr)] = arr
+        self._size = start + len(arr)
+
+    def extend(self, arr: np.ndarray) -> None:
+        self.write(self._size, arr)
@@ -1,10 +1,9 @@
-from scipy.stats import ranksums, shapiro
-
-
 def test_normality_shapirowilk(data, verbose=True):
     """
     Test for normality of `data` using Shapiro-Wilk Test.
     """
+    from scipy.stats import shapiro
+
     _, pval = shapiro(data)
     if pval > 0.05:
         normality = True
@@ -23,6 +22,8 @@ def test_difference_wilcoxon(vec1, vec2, verbose=True):
     """
     Test for differences between `vec1` and `vec2` using Wilcoxon rank sum test (aka Mann-Whitney U test).
     """
+    from scipy.stats import ranksums
+
     res = ranksums(vec1, vec2)
     if res.pvalue > 0.05:
         different = False